@@ -10,16 +10,35 @@ Implements graceful degradation when:
 - API errors occur
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
-from difflib import SequenceMatcher
-from typing import Optional
+from collections import OrderedDict
+from collections.abc import Coroutine, Iterable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, TypeVar, Union
 
-from openai import OpenAI
+import orjson
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+    Timeout,
+)
+from openai.types.shared_params import ResponseFormatJSONSchema
 from pydantic import BaseModel, Field
+from rapidfuzz import fuzz, process
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
     retry_if_exception_type,
 )
 
@@ -34,6 +53,8 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class ClassificationError(Exception):
     """Error during ticket classification."""
@@ -59,14 +80,84 @@ class LLMClassificationResponse(BaseModel):
     )
 
 
+class LLMBatchItem(LLMClassificationResponse):
+    """Classification of one ticket inside a multi-ticket response."""
+    
+    ticket_number: int = Field(
+        description="The 1-based number of the ticket in the user message"
+    )
+
+
+class LLMBatchClassificationResponse(BaseModel):
+    """Structured output schema for classifying several tickets in one call."""
+    
+    results: list[LLMBatchItem] = Field(
+        description="One classification per ticket, in input order"
+    )
+
+
+def json_response_format(model: type[BaseModel]) -> ResponseFormatJSONSchema:
+    """
+    Build a strict ``json_schema`` response format for a pydantic model.
+    
+    Args:
+        model: Pydantic model whose fields are all required.
+        
+    Returns:
+        ``response_format`` payload for the chat completions endpoint.
+    """
+    schema = model.model_json_schema()
+    # Strict mode wants every object closed and every property required,
+    # including nested models referenced through $defs
+    for obj in (schema, *schema.get("$defs", {}).values()):
+        if obj.get("type") == "object":
+            obj["additionalProperties"] = False
+            obj["required"] = list(obj.get("properties", {}))
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "schema": schema, "strict": True},
+    }
+
+
+# Response formats are generated once here rather than by the SDK on every call
+SINGLE_RESPONSE_FORMAT: ResponseFormatJSONSchema = json_response_format(
+    LLMClassificationResponse
+)
+BATCH_RESPONSE_FORMAT: ResponseFormatJSONSchema = json_response_format(
+    LLMBatchClassificationResponse
+)
+
+
+# Errors worth retrying: rate limits, network failures/timeouts and 5xx.
+# Anything else (bad requests, auth, parsing, bugs) fails immediately.
+TRANSIENT_LLM_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+# Retry policy shared by all LLM calls (jittered to spread out retries)
+_llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10) + wait_random(0, 1),
+    retry=retry_if_exception_type(TRANSIENT_LLM_ERRORS),
+    reraise=True,
+    before_sleep=lambda retry_state: logger.warning(
+        f"Retrying classification after error: {retry_state.outcome.exception()}"
+    ),
+)
+
+
 # System prompt with careful instructions for accurate classification
-SYSTEM_PROMPT = """You are an expert IT Service Desk analyst responsible for classifying incoming support requests.
+# Long-form instructions, kept for A/B comparison (LLM_VERBOSE_PROMPT=true)
+VERBOSE_SYSTEM_PROMPT = """You are an expert IT Service Desk analyst responsible for classifying incoming support requests.
 
 Your task is to analyze each helpdesk ticket and assign it to the most appropriate Category and Request Type from the provided Service Catalog.
 
 ## CRITICAL INSTRUCTIONS:
 
-1. **USE ONLY categories and request types from the Service Catalog provided in the user message.**
+1. **USE ONLY categories and request types from the Service Catalog listed at the end of these instructions.**
    Do NOT invent new categories. Use EXACT names from the catalog.
 
 2. **Classification Strategy**:
@@ -175,36 +266,161 @@ Example 9:
 - Confidence: 0.95
 - Reasoning: "Salesforce error is a SaaS platform issue. All SaaS-related requests belong to Software & Licensing."
 
-Now classify the ticket provided in the user message using the Service Catalog listed there."""
+Classify the ticket provided in the user message using the Service Catalog below."""
+
+
+# Compact default instructions: same rules and examples, far fewer tokens
+SYSTEM_PROMPT = """You are an IT Service Desk analyst. Classify each helpdesk ticket into a Category and Request Type from the Service Catalog at the end of these instructions. Use EXACT catalog names; never invent new ones. Identify the primary issue, pick the category, then the most specific type in it.
+
+## Priority Rules (first match wins)
+Security incidents (phishing, lost/stolen device) → Security; authentication (password, MFA) → Access Management; physical equipment → Hardware Support; software/licenses → Software & Licensing; network/connectivity → Network & Connectivity; employee lifecycle → HR & Onboarding; otherwise → Other/Uncategorized.
 
+## Software & Licensing
+Any SaaS app (Jira, Salesforce, Zoom, Slack...) access, login, error or outage → "SaaS Platform Access" (never Access Management, which covers internal AD/Okta/VPN credentials); local install (VS Code, Docker, Python) → "Software Installation Issue"; license (Adobe, Tableau, Office) → "Request New Software License"; other → "Other Software Issue".
 
-def build_user_prompt(request: HelpdeskRequest, catalog: ServiceCatalog) -> str:
+## Hardware Support
+Mouse/keyboard/monitor/cables/headset → "Peripheral Request (Mouse/Keyboard/Monitor)"; laptop/desktop faults → "Laptop Repair/Replacement"; mobile → "Mobile Device Issue"; printers and anything else → "Other Hardware Request".
+
+## Confidence Scoring
+0.9-1.0 exact match; 0.7-0.9 minor interpretation; 0.5-0.7 several categories plausible; <0.5 best effort.
+
+Reasoning: 1-2 sentences on why.
+
+## Examples (ticket → Category / Type / Confidence)
+"Forgot my Okta password" → Access Management / Reset forgotten password / 0.95
+"Lost my work phone in a taxi" → Security / Report Lost/Stolen Device / 0.95
+"Where is the cafeteria?" → Other/Uncategorized / General Inquiry/Undefined / 0.90
+"Jira is down, 500 error" → Software & Licensing / SaaS Platform Access (Jira/Salesforce) / 0.95
+"Need access to Salesforce" → Software & Licensing / SaaS Platform Access (Jira/Salesforce) / 0.95
+"Install VS Code on my machine" → Software & Licensing / Software Installation Issue / 0.95
+"Need new monitor" → Hardware Support / Peripheral Request (Mouse/Keyboard/Monitor) / 0.95
+"3rd floor printer is offline" → Hardware Support / Other Hardware Request / 0.90"""
+
+
+def build_system_prompt(catalog: ServiceCatalog, verbose: bool = False) -> str:
+    """
+    Build the system prompt for classification.
+    
+    The instructions and the catalog are identical for every ticket, so
+    they form one constant prefix that the provider can cache across calls.
+    
+    Args:
+        catalog: The service catalog for reference.
+        verbose: Use the long-form instructions instead of the compact ones.
+        
+    Returns:
+        Instructions followed by the rendered service catalog.
+    """
+    instructions = VERBOSE_SYSTEM_PROMPT if verbose else SYSTEM_PROMPT
+    return f"{instructions}\n\n{catalog.to_classification_context()}"
+
+
+# Static text around the ticket fields, joined once at import
+_SINGLE_PROMPT_HEADER = "## TICKET TO CLASSIFY:\n\n"
+_SINGLE_PROMPT_FOOTER = (
+    "\n\n---\n\n"
+    "Analyze this ticket and provide the classification. "
+    "Use EXACT category and request type names from the Service Catalog."
+)
+_BATCH_PROMPT_FOOTER = (
+    "\n\n---\n\n"
+    "Classify each ticket independently and return exactly one result per "
+    "ticket, in input order, with its ticket_number. "
+    "Use EXACT category and request type names from the Service Catalog."
+)
+
+
+def _format_ticket(request: HelpdeskRequest) -> str:
+    """Render the fields of one ticket, shared by both prompt builders."""
+    return (
+        f"**ID**: {request.id}\n"
+        f"**Short Description**: {request.short_description}\n"
+        f"**Full Description**: {request.long_description}\n"
+        f"**Requester**: {request.requester_email}"
+    )
+
+
+def build_user_prompt(request: HelpdeskRequest) -> str:
     """
     Build the user prompt for classification.
     
+    Contains only the ticket itself; the catalog lives in the system prompt.
+    
     Args:
         request: The helpdesk request to classify.
-        catalog: The service catalog for reference.
         
     Returns:
         Formatted prompt string.
     """
-    catalog_context = catalog.to_classification_context()
+    return _SINGLE_PROMPT_HEADER + _format_ticket(request) + _SINGLE_PROMPT_FOOTER
+
+
+def build_batch_user_prompt(requests: Sequence[HelpdeskRequest]) -> str:
+    """
+    Build the user prompt for classifying several tickets in one call.
     
-    return f"""{catalog_context}
+    Args:
+        requests: The helpdesk requests to classify.
+        
+    Returns:
+        Formatted prompt string with numbered tickets.
+    """
+    tickets = "\n\n".join([
+        f"### Ticket {number}\n\n{_format_ticket(request)}"
+        for number, request in enumerate(requests, 1)
+    ])
+    header = f"## TICKETS TO CLASSIFY ({len(requests)}):\n\n"
+    return header + tickets + _BATCH_PROMPT_FOOTER
 
----
 
-## TICKET TO CLASSIFY:
+def ticket_cache_key(request: HelpdeskRequest) -> str:
+    """
+    Build a cache key from the normalized text of a ticket.
+    
+    Tickets whose descriptions differ only in case or surrounding
+    whitespace share a key.
+    
+    Args:
+        request: The helpdesk request.
+        
+    Returns:
+        Hex digest identifying the ticket text.
+    """
+    text = f"{request.short_description}\n{request.long_description}".lower().strip()
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
-**ID**: {request.id}
-**Short Description**: {request.short_description}
-**Full Description**: {request.long_description}
-**Requester**: {request.requester_email}
 
----
+def _skip_bigrams(text: str) -> frozenset[str]:
+    """
+    Build the set of 0-skip and 1-skip character bigrams of a string.
+    
+    Args:
+        text: Lowercased string.
+        
+    Returns:
+        Set of adjacent (``ab``) and one-apart (``a_c``) character pairs.
+    """
+    pairs = {text[i:i + 2] for i in range(len(text) - 1)}
+    pairs.update(text[i] + text[i + 2] for i in range(len(text) - 2))
+    return frozenset(pairs)
+
 
-Analyze this ticket and provide the classification. Use EXACT category and request type names from the Service Catalog above."""
+class _CandidateIndex:
+    """Catalog names with their precomputed lowercase forms and bigrams."""
+    
+    __slots__ = ("names", "lowered", "exact", "bigrams")
+    
+    def __init__(self, names: Iterable[str]):
+        self.names = tuple(names)
+        self.lowered = [name.lower() for name in self.names]
+        # Lowercase -> original name; the first name wins on collisions
+        self.exact: dict[str, str] = {}
+        for name, name_lower in zip(self.names, self.lowered, strict=True):
+            self.exact.setdefault(name_lower, name)
+        self.bigrams = [_skip_bigrams(name) for name in self.lowered]
+    
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 class TicketClassifier:
@@ -212,7 +428,8 @@ class TicketClassifier:
     LLM-based classifier for IT helpdesk tickets.
     
     Uses OpenAI's API with structured output to ensure consistent,
-    parseable classification results.
+    parseable classification results. Requests are sent through an
+    async client so that a batch keeps several LLM calls in flight.
     
     Implements graceful degradation:
     - Fuzzy matching for category/type names (handles LLM variations)
@@ -228,6 +445,31 @@ class TicketClassifier:
     # Minimum similarity threshold for fuzzy matching (0.0 - 1.0)
     SIMILARITY_THRESHOLD = 0.7
     
+    # Connection pool and timeouts for the OpenAI HTTP client. Both are built
+    # from the SDK's own types: its HTTP client is not necessarily the httpx
+    # package this project uses, and mixing the two breaks every request.
+    HTTP_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=60.0,
+    )
+    HTTP_TIMEOUT = Timeout(120.0, connect=5.0, write=30.0, pool=60.0)
+    
+    # Maximum number of classification results kept in the LRU cache
+    RESULT_CACHE_SIZE = 1024
+    
+    # Maximum number of normalized (category, type) answers remembered
+    NORMALIZE_CACHE_SIZE = 4096
+    
+    # Batch API job states after which no further results will arrive
+    BATCH_TERMINAL_STATUSES = frozenset(
+        {"completed", "failed", "expired", "cancelled"}
+    )
+    
+    # Candidate lists longer than this are narrowed to the top-K entries by
+    # skip-bigram overlap before fuzzy scoring
+    PREFILTER_TOP_K = 10
+    
     def __init__(self, config: LLMConfig, catalog: ServiceCatalog):
         """
         Initialize the classifier.
@@ -239,70 +481,236 @@ class TicketClassifier:
         self._config = config
         self._catalog = catalog
         
-        # Build lookup caches for fuzzy matching
+        # Model asked first, and whether low-confidence answers are re-asked
+        # of the full model
+        self._primary_model = config.small_model or config.model
+        self._escalate = self._primary_model != config.model
+        
+        # Build lookup caches for fuzzy matching (immutable, never copied)
         # Note: Category names should be unique (enforced by data_sources.py)
-        self._category_names = [cat.name for cat in catalog.categories]
-        self._type_names_by_category: dict[str, list[str]] = {}
+        self._category_names = tuple(cat.name for cat in catalog.categories)
+        self._type_names_by_category: dict[str, tuple[str, ...]] = {}
         
         for cat in catalog.categories:
+            type_names = tuple(req.name for req in cat.requests)
             if cat.name in self._type_names_by_category:
                 # Merge request types if somehow duplicate category exists
-                self._type_names_by_category[cat.name].extend(
-                    req.name for req in cat.requests
-                )
+                self._type_names_by_category[cat.name] += type_names
                 logger.warning(f"Duplicate category '{cat.name}' detected, merging request types")
             else:
-                self._type_names_by_category[cat.name] = [req.name for req in cat.requests]
+                self._type_names_by_category[cat.name] = type_names
         
-        # Initialize OpenAI client
-        client_kwargs = {
+        # Flattened request types and the inverse type -> category index.
+        # The first category wins if a type name appears in several.
+        self._all_types = tuple(
+            t for types in self._type_names_by_category.values() for t in types
+        )
+        self._type_to_category: dict[str, str] = {}
+        for cat_name, types in self._type_names_by_category.items():
+            for type_name in types:
+                self._type_to_category.setdefault(type_name, cat_name)
+        
+        # Lowercased candidate lists, so fuzzy matching never re-lowers names
+        self._category_index = _CandidateIndex(self._category_names)
+        self._all_types_index = _CandidateIndex(self._all_types)
+        self._type_index_by_category = {
+            cat_name: _CandidateIndex(types)
+            for cat_name, types in self._type_names_by_category.items()
+        }
+        
+        # (category, type) -> SLA, keyed case-insensitively. Mirrors
+        # ServiceCatalog.get_request_type_sla: the first category and the
+        # first type with a given name win. The exact catalog spelling is
+        # keyed too, so normalized names (always catalog spellings) are
+        # found without lowercasing them per ticket.
+        self._sla_index: dict[tuple[str, str], SLA] = {}
+        seen_categories: set[str] = set()
+        for cat in catalog.categories:
+            cat_lower = cat.name.lower()
+            if cat_lower in seen_categories:
+                continue
+            seen_categories.add(cat_lower)
+            for req in cat.requests:
+                sla = self._sla_index.setdefault((cat_lower, req.name.lower()), req.sla)
+                self._sla_index.setdefault((cat.name, req.name), sla)
+        
+        # Constant prompt prefix shared by every request (prompt-cache friendly)
+        self._system_prompt = build_system_prompt(catalog, config.verbose_prompt)
+        
+        # LRU cache of LLM results keyed by normalized ticket text
+        self._result_cache: OrderedDict[str, ClassificationResult] = OrderedDict()
+        
+        # Normalized (category, type) per raw LLM answer. The catalog is
+        # fixed for the classifier's lifetime, so entries never go stale.
+        # Nothing is evicted; once full, new answers are just not kept.
+        self._normalized: dict[tuple[str, str], tuple[str, str]] = {}
+        
+        # Initialize async OpenAI client
+        client_kwargs: dict[str, Any] = {
             "api_key": config.api_key,
         }
         if config.api_base_url:
             client_kwargs["base_url"] = config.api_base_url
             
-        self._client = OpenAI(**client_kwargs)
+        # Pooled keep-alive connections so concurrent calls reuse TLS sessions
+        client_kwargs["http_client"] = DefaultAsyncHttpxClient(
+            limits=self.HTTP_LIMITS,
+            timeout=self.HTTP_TIMEOUT,
+        )
+            
+        self._client = AsyncOpenAI(**client_kwargs)
+        
+        # Event loop for the synchronous wrappers, created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info(f"Initialized classifier with model: {config.model}")
         logger.info(f"Catalog loaded: {len(catalog.categories)} categories")
     
-    def _find_best_match(self, query: str, candidates: list[str]) -> Optional[str]:
+    def __enter__(self) -> "TicketClassifier":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+    
+    async def aclose(self) -> None:
+        """Close the LLM client."""
+        if not self._client.is_closed():
+            await self._client.close()
+    
+    def close(self) -> None:
+        """
+        Close the classifier from synchronous code.
+        
+        Closes the LLM client on the loop the synchronous methods used,
+        then that loop itself. Safe to call more than once.
+        
+        Raises:
+            RuntimeError: If called while an event loop is running; async
+                callers must await :meth:`aclose` instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "TicketClassifier.close() cannot run inside an event loop; "
+                "await aclose() instead"
+            )
+        
+        loop, self._loop = self._loop, None
+        if loop is None:
+            # The synchronous methods never ran; close on a throwaway loop
+            loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+    
+    def _find_best_match(
+        self,
+        query: str,
+        candidates: Union[Sequence[str], _CandidateIndex],
+    ) -> Optional[str]:
         """
         Find the best matching string from candidates using fuzzy matching.
         
+        Scoring uses RapidFuzz's normalized Indel similarity, which ranks
+        candidates the same way as difflib's ``SequenceMatcher.ratio`` but
+        scores the whole candidate list in a single native call.
+        
         Args:
             query: The string to match.
-            candidates: List of possible matches.
+            candidates: List of possible matches, or a precomputed index.
             
         Returns:
             Best matching candidate or None if no good match found.
         """
+        if not isinstance(candidates, _CandidateIndex):
+            candidates = _CandidateIndex(candidates)
+        
         if not candidates:
             return None
         
         query_lower = query.lower().strip()
         
         # Try exact match first (case-insensitive)
-        for candidate in candidates:
-            if candidate.lower() == query_lower:
-                return candidate
+        exact = candidates.exact.get(query_lower)
+        if exact is not None:
+            return exact
+        
+        # Narrow large candidate lists to the closest entries by bigram overlap
+        choices = self._prefilter_candidates(query_lower, candidates)
         
         # Try fuzzy matching
-        best_match = None
-        best_score = 0.0
+        match = process.extractOne(
+            query_lower,
+            choices,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.SIMILARITY_THRESHOLD * 100,
+        )
+        if match is None:
+            return None
+        
+        _, score, key = match
+        best_match = candidates.names[key]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Fuzzy matched '{query}' -> '{best_match}' (score: {score / 100:.2f})"
+            )
+        return best_match
+    
+    def _prefilter_candidates(
+        self,
+        query_lower: str,
+        candidates: _CandidateIndex,
+    ) -> Union[list[str], dict[int, str]]:
+        """
+        Select the candidates worth fuzzy-scoring for a query.
+        
+        Small candidate lists are returned unchanged. For larger ones,
+        candidates whose length alone rules out reaching the similarity
+        threshold are dropped, the rest are ranked by Jaccard similarity of
+        skip-bigram sets, and only the top ``PREFILTER_TOP_K`` are kept.
         
-        for candidate in candidates:
-            score = SequenceMatcher(None, query_lower, candidate.lower()).ratio()
-            if score > best_score:
-                best_score = score
-                best_match = candidate
+        Args:
+            query_lower: Lowercased, stripped query string.
+            candidates: Precomputed candidate index.
+            
+        Returns:
+            Lowercased choices, either as the full list or as a mapping from
+            position in ``candidates`` to lowercased name.
+        """
+        if len(candidates) <= self.PREFILTER_TOP_K:
+            return candidates.lowered
         
-        if best_score >= self.SIMILARITY_THRESHOLD:
-            if best_score < 1.0:
-                logger.debug(f"Fuzzy matched '{query}' -> '{best_match}' (score: {best_score:.2f})")
-            return best_match
+        # fuzz.ratio is at most 2 * min(len) / (sum of lengths), so these
+        # could never score above the cutoff and must not take a top-K slot
+        query_len = len(query_lower)
+        possible = [
+            idx for idx, name in enumerate(candidates.lowered)
+            if 2 * min(query_len, len(name))
+            >= self.SIMILARITY_THRESHOLD * (query_len + len(name))
+        ]
         
-        return None
+        query_bigrams = _skip_bigrams(query_lower)
+        
+        def jaccard(idx: int) -> float:
+            cand_bigrams = candidates.bigrams[idx]
+            union = len(query_bigrams | cand_bigrams)
+            return len(query_bigrams & cand_bigrams) / union if union else 0.0
+        
+        top = heapq.nlargest(self.PREFILTER_TOP_K, possible, key=jaccard)
+        return {idx: candidates.lowered[idx] for idx in top}
     
     def _find_category_for_type(self, type_name: str) -> Optional[str]:
         """
@@ -314,15 +722,112 @@ class TicketClassifier:
         Returns:
             Category name or None if not found.
         """
-        for cat_name, types in self._type_names_by_category.items():
-            if type_name in types:
-                return cat_name
-        return None
+        return self._type_to_category.get(type_name)
+    
+    def _match_many(
+        self,
+        queries: Iterable[str],
+        candidates: _CandidateIndex,
+    ) -> dict[str, Optional[str]]:
+        """
+        Find the best match for several queries in one native call.
+        
+        Exact (case-insensitive) hits are resolved from the index; the rest
+        are scored together with ``process.cdist``, using the same scorer
+        and threshold as :meth:`_find_best_match`.
+        
+        Args:
+            queries: Strings to match (duplicates are scored once).
+            candidates: Precomputed candidate index.
+            
+        Returns:
+            Mapping of each query to its best match, or None.
+        """
+        matches: dict[str, Optional[str]] = {}
+        pending: list[str] = []
+        for query in dict.fromkeys(queries):
+            matches[query] = candidates.exact.get(query.lower().strip())
+            if matches[query] is None:
+                pending.append(query)
+        
+        if not pending or not candidates:
+            return matches
+        
+        scores = process.cdist(
+            [query.lower().strip() for query in pending],
+            candidates.lowered,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.SIMILARITY_THRESHOLD * 100,
+            workers=-1,
+        )
+        for query, row, best in zip(
+            pending, scores, scores.argmax(axis=1), strict=True
+        ):
+            # Scores under the cutoff are reported as 0
+            if row[best]:
+                matches[query] = candidates.names[best]
+        
+        return matches
+    
+    def _normalize_batch(
+        self,
+        pairs: Sequence[tuple[str, str]],
+    ) -> list[tuple[str, str]]:
+        """
+        Normalize many LLM classifications against the catalog at once.
+        
+        Runs every fuzzy lookup :meth:`_normalize_classification` would need
+        as a handful of ``cdist`` calls (categories, types per matched
+        category, then all types), and replays the per-ticket logic on the
+        precomputed matches.
+        
+        Args:
+            pairs: Raw ``(category, request_type)`` tuples from the LLM.
+            
+        Returns:
+            Normalized ``(category, request_type)`` tuples, in input order.
+        """
+        # Answers normalized before need no fuzzy lookups at all
+        pending = [pair for pair in dict.fromkeys(pairs) if pair not in self._normalized]
+        
+        matches: dict[tuple[_CandidateIndex, str], Optional[str]] = {}
+        
+        def remember(
+            queries: Iterable[str],
+            index: _CandidateIndex,
+        ) -> dict[str, Optional[str]]:
+            found = self._match_many(queries, index)
+            matches.update(((index, query), match) for query, match in found.items())
+            return found
+        
+        categories = remember((c for c, _ in pending), self._category_index)
+        
+        # Types within each matched category
+        types_by_category: dict[str, list[str]] = {}
+        for category, request_type in pending:
+            matched = categories[category]
+            if matched in self._type_index_by_category:
+                types_by_category.setdefault(matched, []).append(request_type)
+        
+        unmatched = [c for c, _ in pending if categories[c] is None]
+        for matched, request_types in types_by_category.items():
+            found = remember(request_types, self._type_index_by_category[matched])
+            unmatched.extend(t for t in request_types if found[t] is None)
+        
+        # Everything still unresolved is looked up across all types
+        remember(unmatched, self._all_types_index)
+        
+        return [
+            self._normalize_classification(category, request_type, matches)
+            for category, request_type in pairs
+        ]
     
     def _normalize_classification(
         self, 
         category: str, 
-        request_type: str
+        request_type: str,
+        matches: Optional[dict[tuple[_CandidateIndex, str], Optional[str]]] = None,
     ) -> tuple[str, str]:
         """
         Normalize LLM output to match actual catalog entries.
@@ -332,22 +837,46 @@ class TicketClassifier:
         - Request type in the category field (common LLM mistake)
         - Category in the request type field
         
+        Results are remembered per raw ``(category, request_type)`` pair, so
+        repeated LLM answers skip fuzzy matching.
+        
         Args:
             category: Raw category from LLM.
             request_type: Raw request type from LLM.
+            matches: Precomputed ``(index, query) -> match`` results from
+                :meth:`_normalize_batch`; missing lookups are computed.
             
         Returns:
             Tuple of (normalized_category, normalized_type).
         """
-        # Build list of all request types for cross-checking
-        all_types = [t for types in self._type_names_by_category.values() for t in types]
+        key = (category, request_type)
+        normalized = self._normalized.get(key)
+        if normalized is None:
+            normalized = self._resolve_classification(category, request_type, matches)
+            if len(self._normalized) < self.NORMALIZE_CACHE_SIZE:
+                self._normalized[key] = normalized
+        return normalized
+    
+    def _resolve_classification(
+        self,
+        category: str,
+        request_type: str,
+        matches: Optional[dict[tuple[_CandidateIndex, str], Optional[str]]],
+    ) -> tuple[str, str]:
+        """Match an LLM classification against the catalog (uncached)."""
+        def find(query: str, index: Union[Sequence[str], _CandidateIndex]) -> Optional[str]:
+            if matches is not None and isinstance(index, _CandidateIndex):
+                key = (index, query)
+                if key in matches:
+                    return matches[key]
+            return self._find_best_match(query, index)
         
         # Step 1: Try to find category directly
-        matched_category = self._find_best_match(category, self._category_names)
+        matched_category = find(category, self._category_index)
         
         if not matched_category:
             # LLM might have put request_type in category field - check if it's a type
-            matched_as_type = self._find_best_match(category, all_types)
+            matched_as_type = find(category, self._all_types_index)
             if matched_as_type:
                 # Found! The "category" is actually a request type
                 matched_category = self._find_category_for_type(matched_as_type)
@@ -366,12 +895,15 @@ class TicketClassifier:
             return self.FALLBACK_CATEGORY, self.FALLBACK_TYPE
         
         # Step 2: Find best matching type within the matched category
-        type_candidates = self._type_names_by_category.get(matched_category, [])
-        matched_type = self._find_best_match(request_type, type_candidates)
+        type_candidates = self._type_names_by_category.get(matched_category, ())
+        matched_type = find(
+            request_type,
+            self._type_index_by_category.get(matched_category, type_candidates),
+        )
         
         if not matched_type:
             # Try to find type in any category as fallback
-            matched_type = self._find_best_match(request_type, all_types)
+            matched_type = find(request_type, self._all_types_index)
             
             if matched_type:
                 # Find which category this type belongs to
@@ -402,18 +934,35 @@ class TicketClassifier:
         
         return matched_category, matched_type
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Exception,)),
-        before_sleep=lambda retry_state: logger.warning(
-            f"Retrying classification after error: {retry_state.outcome.exception()}"
-        ),
-    )
-    def classify_request(self, request: HelpdeskRequest) -> ClassificationResult:
+    @_llm_retry
+    async def _request_single(
+        self,
+        request: HelpdeskRequest,
+        model: Optional[str] = None,
+    ) -> Optional[LLMClassificationResponse]:
+        """Send one LLM call classifying a single ticket."""
+        response = await self._client.chat.completions.create(
+            model=model or self._primary_model,
+            temperature=self._config.temperature,
+            max_tokens=self._config.max_tokens,
+            messages=[
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": build_user_prompt(request)},
+            ],
+            response_format=SINGLE_RESPONSE_FORMAT,
+        )
+        content = response.choices[0].message.content
+        if not content:
+            return None
+        return LLMClassificationResponse.model_validate_json(content)
+    
+    async def classify_request(self, request: HelpdeskRequest) -> ClassificationResult:
         """
         Classify a single helpdesk request.
         
+        Transient API errors are retried; any other failure is raised
+        immediately.
+        
         Args:
             request: The request to classify.
             
@@ -423,69 +972,257 @@ class TicketClassifier:
         Raises:
             ClassificationError: If classification fails after retries.
         """
-        logger.debug(f"Classifying request: {request.id}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        cache_key = ticket_cache_key(request)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            if debug:
+                logger.debug(f"Cache hit for request: {request.id}")
+            return cached
+        
+        if debug:
+            logger.debug(f"Classifying request: {request.id}")
         
         try:
-            user_prompt = build_user_prompt(request, self._catalog)
-            
-            response = self._client.beta.chat.completions.parse(
-                model=self._config.model,
-                temperature=self._config.temperature,
-                max_tokens=self._config.max_tokens,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format=LLMClassificationResponse,
-            )
-            
-            parsed = response.choices[0].message.parsed
+            parsed = await self._request_single(request)
             
             if not parsed:
                 raise ClassificationError(f"Empty response for request {request.id}")
             
-            result = ClassificationResult(
-                request_category=parsed.request_category,
-                request_type=parsed.request_type,
-                confidence=parsed.confidence,
-                reasoning=parsed.reasoning,
-            )
+            if self._needs_escalation(parsed.confidence):
+                parsed = await self._escalate_single(request, parsed)
             
-            logger.debug(
-                f"Classified {request.id}: {result.request_category} / "
-                f"{result.request_type} (confidence: {result.confidence:.2f})"
-            )
+            result = self._to_result(parsed)
             
+            if debug:
+                logger.debug(
+                    f"Classified {request.id}: {result.request_category} / "
+                    f"{result.request_type} (confidence: {result.confidence:.2f})"
+                )
+            
+            self._store_result(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"Classification error for {request.id}: {e}")
             raise ClassificationError(f"Failed to classify {request.id}: {e}") from e
     
-    def classify_and_update(self, request: HelpdeskRequest) -> HelpdeskRequest:
+    def _needs_escalation(self, confidence: float) -> bool:
+        """Check whether a small-model answer should go to the full model."""
+        return self._escalate and confidence < self._config.escalation_confidence
+    
+    async def _escalate_single(
+        self,
+        request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ) -> LLMClassificationResponse:
+        """Re-classify a low-confidence answer with the full model."""
+        logger.debug(
+            f"Escalating {request.id} to {self._config.model} "
+            f"(confidence: {parsed.confidence:.2f})"
+        )
+        try:
+            escalated = await self._request_single(request, self._config.model)
+        except Exception as e:
+            logger.warning(
+                f"Escalation failed for {request.id}, keeping first answer: {e}"
+            )
+            return parsed
+        return escalated or parsed
+    
+    @staticmethod
+    def _to_result(parsed: LLMClassificationResponse) -> ClassificationResult:
         """
-        Classify a request and return an updated copy with classification.
+        Convert a parsed LLM answer to a ClassificationResult.
         
-        Implements graceful degradation:
-        - Normalizes LLM output to match catalog
-        - Falls back to defaults if lookup fails
+        The answer was already validated against the same field constraints
+        when the response was parsed, so it is not validated a second time.
+        """
+        return ClassificationResult.model_construct(
+            request_category=parsed.request_category,
+            request_type=parsed.request_type,
+            confidence=parsed.confidence,
+            reasoning=parsed.reasoning,
+        )
+    
+    def _store_result(self, cache_key: str, result: ClassificationResult) -> None:
+        """Store a result in the LRU cache, evicting the oldest entry if full."""
+        self._result_cache[cache_key] = result
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    @_llm_retry
+    async def _request_batch(
+        self,
+        requests: Sequence[HelpdeskRequest],
+        model: Optional[str] = None,
+    ) -> LLMBatchClassificationResponse:
+        """Send one LLM call classifying all given tickets."""
+        response = await self._client.chat.completions.create(
+            model=model or self._primary_model,
+            temperature=self._config.temperature,
+            max_tokens=self._config.max_tokens * len(requests),
+            messages=[
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": build_batch_user_prompt(requests)},
+            ],
+            response_format=BATCH_RESPONSE_FORMAT,
+        )
+        
+        content = response.choices[0].message.content
+        if not content:
+            raise ClassificationError("Empty response for ticket batch")
+        return LLMBatchClassificationResponse.model_validate_json(content)
+    
+    @classmethod
+    def _results_from_batch(
+        cls,
+        parsed: LLMBatchClassificationResponse,
+        count: int,
+    ) -> list[Optional[ClassificationResult]]:
+        """
+        Map a multi-ticket response back onto its tickets.
+        
+        Items with an out-of-range ticket number are ignored, and the first
+        item wins if a number repeats.
         
         Args:
-            request: The request to classify.
+            parsed: Structured output of one batch call.
+            count: Number of tickets sent in that call.
             
         Returns:
-            Updated HelpdeskRequest with filled classification fields.
+            One ClassificationResult (or None) per ticket, in call order.
+        """
+        results: list[Optional[ClassificationResult]] = [None] * count
+        for item in parsed.results:
+            if not 1 <= item.ticket_number <= count:
+                continue
+            if results[item.ticket_number - 1] is not None:
+                continue
+            results[item.ticket_number - 1] = cls._to_result(item)
+        return results
+    
+    async def _escalate_batch(
+        self,
+        requests: Sequence[HelpdeskRequest],
+    ) -> list[Optional[ClassificationResult]]:
+        """Re-classify low-confidence answers with the full model in one call."""
+        logger.debug(f"Escalating {len(requests)} requests to {self._config.model}")
+        try:
+            parsed = await self._request_batch(requests, self._config.model)
+        except Exception as e:
+            logger.warning(f"Batch escalation failed, keeping first answers: {e}")
+            return [None] * len(requests)
+        return self._results_from_batch(parsed, len(requests))
+    
+    async def classify_requests(
+        self,
+        requests: Sequence[HelpdeskRequest],
+    ) -> list[Optional[ClassificationResult]]:
         """
-        result = self.classify_request(request)
+        Classify several helpdesk requests with a single LLM call.
         
+        Cached tickets are answered from the result cache and left out of
+        the call. Tickets the LLM skipped or numbered incorrectly come back
+        as ``None`` so the caller can retry them individually.
+        
+        Args:
+            requests: The requests to classify.
+            
+        Returns:
+            One ClassificationResult (or None) per request, in input order.
+            
+        Raises:
+            ClassificationError: If the batch call fails after retries.
+        """
+        keys = [ticket_cache_key(r) for r in requests]
+        results: list[Optional[ClassificationResult]] = [
+            self._result_cache.get(key) for key in keys
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        batch = [requests[i] for i in pending]
+        logger.debug(f"Classifying {len(batch)} requests in one call")
+        
+        try:
+            parsed = await self._request_batch(batch)
+        except Exception as e:
+            logger.error(f"Batch classification error: {e}")
+            raise ClassificationError(f"Failed to classify ticket batch: {e}") from e
+        
+        batch_results = self._results_from_batch(parsed, len(batch))
+        for idx, result in zip(pending, batch_results, strict=True):
+            results[idx] = result
+        
+        missing = sum(1 for i in pending if results[i] is None)
+        if missing:
+            logger.warning(f"Batch response omitted {missing} of {len(batch)} tickets")
+        
+        low = [
+            i for i in pending
+            if (result := results[i]) is not None
+            and self._needs_escalation(result.confidence)
+        ]
+        if low:
+            escalated = await self._escalate_batch([requests[i] for i in low])
+            for idx, result in zip(low, escalated, strict=True):
+                if result is not None:
+                    results[idx] = result
+        
+        for idx in pending:
+            result = results[idx]
+            if result is not None:
+                self._store_result(keys[idx], result)
+        
+        return results
+    
+    def _apply_classification(
+        self,
+        request: HelpdeskRequest,
+        result: ClassificationResult,
+    ) -> HelpdeskRequest:
+        """
+        Write a normalized classification and its SLA onto a request.
+        
+        Args:
+            request: The request to update.
+            result: Raw classification from the LLM.
+            
+        Returns:
+            The updated request.
+        """
         # Normalize classification to match actual catalog entries
         category, request_type = self._normalize_classification(
             result.request_category,
             result.request_type
         )
+        return self._apply_normalized(request, category, request_type)
+    
+    def _apply_normalized(
+        self,
+        request: HelpdeskRequest,
+        category: str,
+        request_type: str,
+    ) -> HelpdeskRequest:
+        """
+        Write an already-normalized classification and its SLA onto a request.
         
+        Args:
+            request: The request to update.
+            category: Catalog category name.
+            request_type: Catalog request type name.
+            
+        Returns:
+            The updated request.
+        """
         # Look up SLA from catalog
-        sla = self._catalog.get_request_type_sla(category, request_type)
+        sla = self._sla_index.get((category, request_type)) or self._sla_index.get(
+            (category.lower(), request_type.lower())
+        )
         
         if not sla:
             logger.warning(
@@ -500,42 +1237,447 @@ class TicketClassifier:
         
         return request
     
-    def classify_batch(
+    @staticmethod
+    def _copy_classification(
+        source: HelpdeskRequest,
+        target: HelpdeskRequest,
+    ) -> HelpdeskRequest:
+        """Give a duplicate ticket the classification of its twin."""
+        target.request_category = source.request_category
+        target.request_type = source.request_type
+        target.sla = source.sla
+        return target
+    
+    def _apply_fallback(self, request: HelpdeskRequest) -> HelpdeskRequest:
+        """Assign the fallback classification to a request."""
+        request.request_category = self.FALLBACK_CATEGORY
+        request.request_type = self.FALLBACK_TYPE
+        request.sla = self.FALLBACK_SLA
+        return request
+    
+    async def classify_and_update(self, request: HelpdeskRequest) -> HelpdeskRequest:
+        """
+        Classify a request and write the classification onto it.
+        
+        The request is updated in place (no copy is made) and returned;
+        only the classification fields and SLA change.
+        
+        Implements graceful degradation:
+        - Normalizes LLM output to match catalog
+        - Falls back to defaults if lookup fails
+        
+        Args:
+            request: The request to classify.
+            
+        Returns:
+            Updated HelpdeskRequest with filled classification fields.
+        """
+        result = await self.classify_request(request)
+        category, request_type = self._normalize_classification(
+            result.request_category,
+            result.request_type,
+        )
+        return self._apply_normalized(request, category, request_type)
+    
+    async def _classify_one_safely(self, request: HelpdeskRequest) -> HelpdeskRequest:
+        """Classify a single request, assigning the fallback on failure."""
+        try:
+            return await self.classify_and_update(request)
+        except ClassificationError as e:
+            logger.error(f"Failed to classify request {request.id}: {e}")
+            # Assign to fallback category on failure - don't break the pipeline
+            return self._apply_fallback(request)
+    
+    async def _classify_chunk(
+        self,
+        chunk: list[HelpdeskRequest],
+    ) -> list[HelpdeskRequest]:
+        """
+        Classify one chunk of requests with a single LLM call.
+        
+        Falls back to per-ticket calls for the whole chunk if the batch call
+        fails, and for any ticket the batch response did not cover.
+        """
+        if len(chunk) == 1:
+            return [await self._classify_one_safely(chunk[0])]
+        
+        try:
+            results = await self.classify_requests(chunk)
+        except ClassificationError as e:
+            logger.warning(f"Batch call failed, classifying tickets individually: {e}")
+            results = [None] * len(chunk)
+        
+        classified = list(chunk)
+        retry_indexes = [idx for idx, result in enumerate(results) if result is None]
+        answered = [
+            (idx, result) for idx, result in enumerate(results) if result is not None
+        ]
+        
+        # Normalize the whole chunk against the catalog in one pass
+        normalized = self._normalize_batch([
+            (result.request_category, result.request_type) for _, result in answered
+        ])
+        for (idx, _), (category, request_type) in zip(
+            answered, normalized, strict=True
+        ):
+            classified[idx] = self._apply_normalized(chunk[idx], category, request_type)
+        
+        retried = await asyncio.gather(
+            *(self._classify_one_safely(chunk[idx]) for idx in retry_indexes)
+        )
+        for idx, request in zip(retry_indexes, retried, strict=True):
+            classified[idx] = request
+        
+        return classified
+    
+    @staticmethod
+    def _read_checkpoint(path: Path) -> dict[str, HelpdeskRequest]:
+        """
+        Load requests already classified by a previous run.
+        
+        Lines that fail to parse (e.g. a record cut short by a crash) are
+        skipped, so those tickets are simply classified again.
+        
+        Args:
+            path: JSONL checkpoint file; a missing file means no progress.
+            
+        Returns:
+            Mapping of request ID to the checkpointed request.
+        """
+        done: dict[str, HelpdeskRequest] = {}
+        if not path.exists():
+            return done
+        
+        with path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    request = HelpdeskRequest.model_validate_json(line)
+                except ValueError as e:
+                    logger.warning(f"Ignoring unreadable checkpoint line {line_no}: {e}")
+                    continue
+                done[request.id] = request
+        
+        return done
+    
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        """Check whether a non-empty file's last byte is a newline."""
+        with path.open("rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+    
+    async def classify_batch_async(
         self, 
         requests: list[HelpdeskRequest],
         batch_size: int = 5,
+        concurrency: Optional[int] = None,
+        output_jsonl: Optional[Path] = None,
+        resume: bool = True,
     ) -> list[HelpdeskRequest]:
         """
-        Classify multiple requests with progress logging.
+        Classify multiple requests with batched, concurrent LLM calls.
+        
+        Requests are packed ``batch_size`` at a time into a single chat
+        completion, and up to ``concurrency`` of those calls are kept in
+        flight at once.
+        
+        With ``output_jsonl`` set, every classified request is appended to
+        that file as soon as its chunk completes. When ``resume`` is true,
+        requests already present in the file are not sent to the LLM again.
         
         Args:
             requests: List of requests to classify.
-            batch_size: Number of requests to process before logging progress.
+            batch_size: Number of tickets sent per LLM call.
+            concurrency: Maximum number of concurrent LLM calls
+                (defaults to ``LLMConfig.max_concurrency``).
+            output_jsonl: Optional JSONL checkpoint file.
+            resume: Reuse results from an existing checkpoint instead of
+                overwriting it.
             
         Returns:
-            List of classified requests.
+            List of classified requests, in input order.
         """
+        done: dict[str, HelpdeskRequest] = {}
+        if output_jsonl is not None and resume:
+            done = self._read_checkpoint(output_jsonl)
+        
+        pending = [r for r in requests if r.id not in done]
+        
+        # Tickets with identical text are classified once and fanned out
+        groups: dict[str, list[int]] = {}
+        for idx, request in enumerate(pending):
+            groups.setdefault(ticket_cache_key(request), []).append(idx)
+        unique = [pending[idxs[0]] for idxs in groups.values()]
+        
         total = len(requests)
-        classified = []
+        completed = total - len(unique)
+        batch_size = max(1, batch_size)
+        semaphore = asyncio.Semaphore(max(1, concurrency or self._config.max_concurrency))
         
         logger.info(f"Starting classification of {total} requests")
+        if done:
+            logger.info(f"Resuming from checkpoint: {len(done)} requests already classified")
+        if len(unique) < len(pending):
+            logger.info(
+                f"Classifying {len(unique)} unique tickets "
+                f"({len(pending) - len(unique)} duplicates share a result)"
+            )
         
-        for i, request in enumerate(requests, 1):
-            try:
-                classified_request = self.classify_and_update(request)
-                classified.append(classified_request)
-                
-                if i % batch_size == 0 or i == total:
-                    logger.info(f"Progress: {i}/{total} requests classified")
-                    
-            except ClassificationError as e:
-                logger.error(f"Failed to classify request {request.id}: {e}")
-                # Assign to fallback category on failure - don't break the pipeline
-                request.request_category = self.FALLBACK_CATEGORY
-                request.request_type = self.FALLBACK_TYPE
-                request.sla = self.FALLBACK_SLA
-                classified.append(request)
+        checkpoint = None
+        if output_jsonl is not None:
+            output_jsonl.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered so each record reaches the file as it is written
+            checkpoint = output_jsonl.open(
+                "a" if resume else "w", encoding="utf-8", buffering=1
+            )
+            # Terminate a record left half-written by a crash before appending
+            if checkpoint.tell() and not self._ends_with_newline(output_jsonl):
+                checkpoint.write("\n")
+        
+        async def worker(chunk: list[HelpdeskRequest]) -> list[HelpdeskRequest]:
+            nonlocal completed
+            async with semaphore:
+                classified_chunk = await self._classify_chunk(chunk)
+            
+            if checkpoint is not None:
+                for request in classified_chunk:
+                    checkpoint.write(request.model_dump_json() + "\n")
+            
+            completed += len(chunk)
+            logger.info(f"Progress: {completed}/{total} requests classified")
+            return classified_chunk
+        
+        chunks = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+        fresh: list[HelpdeskRequest] = list(pending)
+        try:
+            classified_chunks = await asyncio.gather(*(worker(c) for c in chunks))
+            
+            unique_results = (r for chunk in classified_chunks for r in chunk)
+            for idxs, result in zip(groups.values(), unique_results, strict=True):
+                fresh[idxs[0]] = result
+                for idx in idxs[1:]:
+                    fresh[idx] = self._copy_classification(result, pending[idx])
+                    if checkpoint is not None:
+                        checkpoint.write(fresh[idx].model_dump_json() + "\n")
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        
+        fresh_iter = iter(fresh)
+        classified = [
+            done[r.id] if r.id in done else next(fresh_iter) for r in requests
+        ]
         
         logger.info(f"Classification complete: {len(classified)} requests processed")
         return classified
-
+    
+    def classify_batch(
+        self, 
+        requests: list[HelpdeskRequest],
+        batch_size: int = 5,
+        concurrency: Optional[int] = None,
+        output_jsonl: Optional[Path] = None,
+        resume: bool = True,
+    ) -> list[HelpdeskRequest]:
+        """
+        Synchronous wrapper around :meth:`classify_batch_async`.
+        
+        Runs on the classifier's private event loop (see :meth:`_run_sync`),
+        so it cannot be called from inside a running loop.
+        
+        Args:
+            requests: List of requests to classify.
+            batch_size: Number of tickets sent per LLM call.
+            concurrency: Maximum number of concurrent LLM calls.
+            output_jsonl: Optional JSONL checkpoint file.
+            resume: Skip requests already present in the checkpoint.
+            
+        Returns:
+            List of classified requests.
+        """
+        return self._run_sync(self.classify_batch_async(
+            requests, batch_size, concurrency, output_jsonl, resume
+        ))
+    
+    def _run_sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run a coroutine on the classifier's own event loop.
+        
+        The loop is created on the first call and kept until :meth:`close`,
+        because the client's pooled connections belong to the loop they were
+        opened on. Use either the synchronous or the async methods on a
+        given classifier.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def _batch_input_line(self, custom_id: str, request: HelpdeskRequest) -> bytes:
+        """Serialize one ticket as a Batch API chat-completions request."""
+        return orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self._primary_model,
+                "temperature": self._config.temperature,
+                "max_tokens": self._config.max_tokens,
+                "messages": [
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": build_user_prompt(request)},
+                ],
+                "response_format": SINGLE_RESPONSE_FORMAT,
+            },
+        })
+    
+    async def _run_offline_batch(
+        self,
+        requests: Sequence[HelpdeskRequest],
+        poll_interval: float,
+    ) -> dict[str, LLMClassificationResponse]:
+        """
+        Submit requests as one Batch API job and wait for its results.
+        
+        Each ticket's ``custom_id`` is its position in ``requests``, so
+        duplicate ticket IDs cannot collide.
+        
+        Args:
+            requests: Tickets to classify.
+            poll_interval: Seconds between job status checks.
+            
+        Returns:
+            Parsed classification per ``custom_id``; tickets whose result is
+            missing or unusable are left out.
+        """
+        payload = b"\n".join(
+            self._batch_input_line(str(idx), request)
+            for idx, request in enumerate(requests)
+        )
+        
+        input_file = await self._client.files.create(
+            file=("classification_batch.jsonl", payload),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted Batch API job {batch.id} with {len(requests)} requests")
+        
+        while batch.status not in self.BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+            logger.debug(f"Batch API job {batch.id} status: {batch.status}")
+        
+        if batch.status != "completed":
+            logger.warning(f"Batch API job {batch.id} ended with status '{batch.status}'")
+        if not batch.output_file_id:
+            return {}
+        
+        content = await self._client.files.content(batch.output_file_id)
+        parsed: dict[str, LLMClassificationResponse] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+                message = record["response"]["body"]["choices"][0]["message"]
+                parsed[record["custom_id"]] = (
+                    LLMClassificationResponse.model_validate_json(message["content"])
+                )
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unusable Batch API result: {e}")
+        
+        return parsed
+    
+    async def classify_batch_offline_async(
+        self,
+        requests: list[HelpdeskRequest],
+        poll_interval: float = 30.0,
+    ) -> list[HelpdeskRequest]:
+        """
+        Classify requests through the OpenAI Batch API.
+        
+        Meant for large, non-interactive runs: the whole set is submitted as
+        one job, which is billed at a discount but may take up to 24 hours.
+        Cached tickets are not resubmitted. Tickets the job does not return
+        a usable result for are classified with :meth:`classify_batch_async`.
+        Job results are not escalated to the full model.
+        
+        Args:
+            requests: List of requests to classify.
+            poll_interval: Seconds between job status checks.
+            
+        Returns:
+            List of classified requests, in input order.
+        """
+        keys = [ticket_cache_key(r) for r in requests]
+        results: list[Optional[ClassificationResult]] = [
+            self._result_cache.get(key) for key in keys
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        if pending:
+            try:
+                parsed = await self._run_offline_batch(
+                    [requests[i] for i in pending], poll_interval
+                )
+            except Exception as e:
+                logger.error(f"Batch API job failed, classifying online instead: {e}")
+                parsed = {}
+            
+            for position, idx in enumerate(pending):
+                item = parsed.get(str(position))
+                if item is None:
+                    continue
+                result = self._to_result(item)
+                results[idx] = result
+                self._store_result(keys[idx], result)
+        
+        classified = list(requests)
+        answered = [
+            (idx, result) for idx, result in enumerate(results) if result is not None
+        ]
+        normalized = self._normalize_batch([
+            (result.request_category, result.request_type) for _, result in answered
+        ])
+        for (idx, _), (category, request_type) in zip(
+            answered, normalized, strict=True
+        ):
+            classified[idx] = self._apply_normalized(
+                requests[idx], category, request_type
+            )
+        
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(
+                f"Classifying {len(missing)} requests without Batch API results online"
+            )
+            retried = await self.classify_batch_async([requests[idx] for idx in missing])
+            for idx, request in zip(missing, retried, strict=True):
+                classified[idx] = request
+        
+        return classified
+    
+    def classify_batch_offline(
+        self,
+        requests: list[HelpdeskRequest],
+        poll_interval: float = 30.0,
+    ) -> list[HelpdeskRequest]:
+        """
+        Synchronous wrapper around :meth:`classify_batch_offline_async`.
+        
+        Runs on the classifier's private event loop (see :meth:`_run_sync`),
+        so it cannot be called from inside a running loop.
+        
+        Args:
+            requests: List of requests to classify.
+            poll_interval: Seconds between job status checks.
+            
+        Returns:
+            List of classified requests.
+        """
+        return self._run_sync(self.classify_batch_offline_async(requests, poll_interval))
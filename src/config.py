@@ -2,72 +2,128 @@
 Configuration module for the Ticket Automation System.
 
 Handles all configuration through environment variables with secure defaults.
-Never stores sensitive data directly in code.
+Never stores sensitive data directly in code. Values set in the process
+environment take precedence over the .env file, which is parsed once, on
+first use rather than at import time, and never copied into os.environ.
 """
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 
-# Load environment variables from .env file
-load_dotenv()
+@lru_cache(maxsize=1)
+def _dotenv_values() -> dict[str, Optional[str]]:
+    """Parse the .env file once, without copying it into os.environ."""
+    return dotenv_values()
 
 
-@dataclass(frozen=True)
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read a setting from the process environment, then the .env file.
+    
+    Args:
+        name: Environment variable name.
+        default: Value used when neither source defines the variable.
+        
+    Returns:
+        The configured value, or ``default``.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        value = _dotenv_values().get(name)
+    return default if value is None else value
+
+
+def _flag(value: str) -> bool:
+    """Interpret an environment value as a boolean switch."""
+    return value.lower() == "true"
+
+
+def _non_empty(value: str) -> Optional[str]:
+    """Treat an empty environment value as unset."""
+    return value or None
+
+
+def _optional_path(value: str) -> Optional[Path]:
+    """Treat an empty environment value as no path."""
+    return Path(value) if value else None
+
+
+def _env_field(
+    name: str,
+    default: Optional[str] = None,
+    parse: Optional[Callable[[str], Any]] = None,
+) -> Any:
+    """
+    Declare a dataclass field whose default is read via :func:`_env`.
+    
+    Args:
+        name: Environment variable name.
+        default: Raw value used when the variable is not set.
+        parse: Optional converter applied to the raw string value.
+        
+    Returns:
+        A ``dataclasses.field`` with the matching default factory.
+    """
+    def factory() -> Any:
+        value = _env(name, default)
+        if parse is None or value is None:
+            return value
+        return parse(value)
+    
+    return field(default_factory=factory)
+
+
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """Configuration for external API endpoints."""
     
     # Helpdesk API configuration
-    helpdesk_webhook_url: str = field(
-        default_factory=lambda: os.getenv("HELPDESK_WEBHOOK_URL", "")
-    )
-    helpdesk_api_key: str = field(
-        default_factory=lambda: os.getenv("HELPDESK_API_KEY", "")
-    )
-    helpdesk_api_secret: str = field(
-        default_factory=lambda: os.getenv("HELPDESK_API_SECRET", "")
-    )
+    helpdesk_webhook_url: str = _env_field("HELPDESK_WEBHOOK_URL", "")
+    helpdesk_api_key: str = _env_field("HELPDESK_API_KEY", "")
+    helpdesk_api_secret: str = _env_field("HELPDESK_API_SECRET", "")
     
     # Service Catalog URL
-    service_catalog_url: str = field(
-        default_factory=lambda: os.getenv("SERVICE_CATALOG_URL", "")
+    service_catalog_url: str = _env_field("SERVICE_CATALOG_URL", "")
+    # Optional file remembering the catalog's ETag/Last-Modified between runs
+    service_catalog_cache_file: Optional[Path] = _env_field(
+        "SERVICE_CATALOG_CACHE_FILE", parse=_optional_path
     )
     
     # Request timeout in seconds
-    request_timeout: int = field(
-        default_factory=lambda: int(os.getenv("REQUEST_TIMEOUT", "30"))
-    )
+    request_timeout: int = _env_field("REQUEST_TIMEOUT", "30", int)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Configuration for LLM API (OpenAI compatible)."""
     
-    api_key: str = field(
-        default_factory=lambda: os.getenv("OPENAI_API_KEY", "")
-    )
-    api_base_url: Optional[str] = field(
-        default_factory=lambda: os.getenv("OPENAI_API_BASE", None)
-    )
-    model: str = field(
-        default_factory=lambda: os.getenv("LLM_MODEL", "gpt-4o-mini")
-    )
-    temperature: float = field(
-        default_factory=lambda: float(os.getenv("LLM_TEMPERATURE", "0.1"))
-    )
-    max_tokens: int = field(
-        default_factory=lambda: int(os.getenv("LLM_MAX_TOKENS", "500"))
-    )
-    max_retries: int = field(
-        default_factory=lambda: int(os.getenv("LLM_MAX_RETRIES", "3"))
-    )
-
-
-@dataclass(frozen=True)
+    api_key: str = _env_field("OPENAI_API_KEY", "")
+    api_base_url: Optional[str] = _env_field("OPENAI_API_BASE")
+    model: str = _env_field("LLM_MODEL", "gpt-4o-mini")
+    temperature: float = _env_field("LLM_TEMPERATURE", "0.1", float)
+    max_tokens: int = _env_field("LLM_MAX_TOKENS", "500", int)
+    max_retries: int = _env_field("LLM_MAX_RETRIES", "3", int)
+    # Maximum number of LLM calls in flight at once
+    max_concurrency: int = _env_field("LLM_MAX_CONCURRENCY", "4", int)
+    # Optional smaller model tried first; `model` then only re-classifies
+    # results with confidence below `escalation_confidence`
+    small_model: Optional[str] = _env_field("LLM_SMALL_MODEL", parse=_non_empty)
+    escalation_confidence: float = _env_field(
+        "LLM_ESCALATION_CONFIDENCE", "0.5", float
+    )
+    # Send the long-form system prompt instead of the compact default
+    verbose_prompt: bool = _env_field("LLM_VERBOSE_PROMPT", "false", _flag)
+
+
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """
     Configuration for email sending via SMTP.
@@ -76,67 +132,62 @@ class EmailConfig:
     """
     
     # SMTP settings
-    smtp_host: str = field(
-        default_factory=lambda: os.getenv("SMTP_HOST", "smtp.gmail.com")
-    )
-    smtp_port: int = field(
-        default_factory=lambda: int(os.getenv("SMTP_PORT", "587"))
-    )
-    smtp_username: str = field(
-        default_factory=lambda: os.getenv("SMTP_USERNAME", "")
-    )
-    smtp_password: str = field(
-        default_factory=lambda: os.getenv("SMTP_PASSWORD", "")
-    )
-    smtp_use_tls: bool = field(
-        default_factory=lambda: os.getenv("SMTP_USE_TLS", "true").lower() == "true"
-    )
+    smtp_host: str = _env_field("SMTP_HOST", "smtp.gmail.com")
+    smtp_port: int = _env_field("SMTP_PORT", "587", int)
+    smtp_username: str = _env_field("SMTP_USERNAME", "")
+    smtp_password: str = _env_field("SMTP_PASSWORD", "")
+    smtp_use_tls: bool = _env_field("SMTP_USE_TLS", "true", _flag)
     
     # Sender settings
-    from_email: str = field(
-        default_factory=lambda: os.getenv("FROM_EMAIL", "")
-    )
-    from_name: str = field(
-        default_factory=lambda: os.getenv("FROM_NAME", "Ticket Automation System")
-    )
+    from_email: str = _env_field("FROM_EMAIL", "")
+    from_name: str = _env_field("FROM_NAME", "Ticket Automation System")
     
     # Recipient for the report
-    recipient_email: str = field(
-        default_factory=lambda: os.getenv("RECIPIENT_EMAIL", "")
-    )
+    recipient_email: str = _env_field("RECIPIENT_EMAIL", "")
     
     # Link to codebase for the email
-    codebase_link: str = field(
-        default_factory=lambda: os.getenv("CODEBASE_LINK", "")
-    )
+    codebase_link: str = _env_field("CODEBASE_LINK", "")
     
     # Sender's name for the subject
-    sender_name: str = field(
-        default_factory=lambda: os.getenv("SENDER_NAME", "")
-    )
+    sender_name: str = _env_field("SENDER_NAME", "")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputConfig:
     """Configuration for output files."""
     
-    output_dir: Path = field(
-        default_factory=lambda: Path(os.getenv("OUTPUT_DIR", "./output"))
+    output_dir: Path = _env_field("OUTPUT_DIR", "./output", Path)
+    report_filename: str = _env_field(
+        "REPORT_FILENAME", "classified_tickets_report.xlsx"
     )
-    report_filename: str = field(
-        default_factory=lambda: os.getenv(
-            "REPORT_FILENAME", 
-            "classified_tickets_report.xlsx"
+    # Full path to the report file, derived once from the fields above
+    report_path: Path = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the report path (the instance is frozen)."""
+        object.__setattr__(
+            self, "report_path", self.output_dir / self.report_filename
         )
+
+
+# Settings that must be non-empty, as (section, attribute path, message)
+_REQUIRED_SETTINGS = tuple(
+    (path.partition(".")[0], attrgetter(path), message)
+    for path, message in (
+        ("api.helpdesk_webhook_url", "HELPDESK_WEBHOOK_URL is required"),
+        ("api.service_catalog_url", "SERVICE_CATALOG_URL is required"),
+        ("api.helpdesk_api_key", "HELPDESK_API_KEY is required"),
+        ("llm.api_key", "OPENAI_API_KEY is required for classification"),
+        ("email.smtp_username", "SMTP_USERNAME is required"),
+        ("email.smtp_password", "SMTP_PASSWORD (App Password) is required"),
+        ("email.from_email", "FROM_EMAIL is required for sending emails"),
+        ("email.recipient_email", "RECIPIENT_EMAIL is required"),
+        ("email.sender_name", "SENDER_NAME is required for email subject"),
     )
-    
-    @property
-    def report_path(self) -> Path:
-        """Get full path to the report file."""
-        return self.output_dir / self.report_filename
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration aggregating all config sections."""
     
@@ -146,55 +197,40 @@ class AppConfig:
     output: OutputConfig = field(default_factory=OutputConfig)
     
     # Logging level
-    log_level: str = field(
-        default_factory=lambda: os.getenv("LOG_LEVEL", "INFO")
-    )
+    log_level: str = _env_field("LOG_LEVEL", "INFO")
     
-    # Batch size for LLM requests (to avoid rate limits)
-    classification_batch_size: int = field(
-        default_factory=lambda: int(os.getenv("CLASSIFICATION_BATCH_SIZE", "5"))
+    # Number of tickets classified per LLM request
+    classification_batch_size: int = _env_field(
+        "CLASSIFICATION_BATCH_SIZE", "5", int
     )
     
-    def validate(self) -> list[str]:
+    def validate(self, include_email: bool = True) -> list[str]:
         """
         Validate configuration and return list of errors.
         
+        Args:
+            include_email: Also require the settings needed to send the
+                report email.
+        
         Returns:
             List of validation error messages (empty if valid).
         """
-        errors = []
-        
-        # Validate required API endpoints
-        if not self.api.helpdesk_webhook_url:
-            errors.append("HELPDESK_WEBHOOK_URL is required")
-        if not self.api.service_catalog_url:
-            errors.append("SERVICE_CATALOG_URL is required")
-        if not self.api.helpdesk_api_key:
-            errors.append("HELPDESK_API_KEY is required")
-        
-        # Validate LLM configuration
-        if not self.llm.api_key:
-            errors.append("OPENAI_API_KEY is required for classification")
-        
-        # Validate email configuration
-        if not self.email.smtp_username:
-            errors.append("SMTP_USERNAME is required")
-        if not self.email.smtp_password:
-            errors.append("SMTP_PASSWORD (App Password) is required")
-        if not self.email.from_email:
-            errors.append("FROM_EMAIL is required for sending emails")
-        if not self.email.recipient_email:
-            errors.append("RECIPIENT_EMAIL is required")
-        if not self.email.sender_name:
-            errors.append("SENDER_NAME is required for email subject")
-        
-        return errors
+        return [
+            message
+            for section, getter, message in _REQUIRED_SETTINGS
+            if not getter(self) and (include_email or section != "email")
+        ]
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """
     Get application configuration singleton.
     
+    The environment is read on the first call only; later calls return the
+    same frozen instance. Use ``get_config.cache_clear()`` to force a reload
+    (e.g. in tests that patch the environment).
+    
     Returns:
         AppConfig instance with all settings loaded from environment.
     """
@@ -5,12 +5,15 @@ Implements secure email sending via SMTP with TLS.
 Designed for use with Gmail App Passwords.
 """
 
+import base64
 import logging
 import smtplib
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from collections.abc import Iterator
+from contextlib import contextmanager
+from email.message import EmailMessage
 from pathlib import Path
+from types import TracebackType
+from typing import Optional
 
 from .config import EmailConfig
 
@@ -36,14 +39,50 @@ class SMTPEmailSender:
         - App Password recommended over regular password
     """
     
+    # Seconds to wait for the SMTP server
+    SMTP_TIMEOUT = 30
+    # Reconnect after this many messages (providers cap messages per session)
+    MAX_MESSAGES_PER_CONNECTION = 100
+    # Attachment read size; a multiple of 57 bytes (one 76-char base64 line)
+    # so that chunks encode to whole lines
+    ATTACHMENT_CHUNK_SIZE = 57 * 36 * 1024
+    
     def __init__(self, config: EmailConfig):
         """
         Initialize SMTP sender.
         
+        The SMTP connection is opened on the first send and reused by later
+        sends until :meth:`close` is called (or the context manager exits).
+        
         Args:
             config: Email configuration with SMTP settings.
         """
         self._config = config
+        self._server: Optional[smtplib.SMTP] = None
+        self._sent_count = 0
+    
+    def __enter__(self) -> "SMTPEmailSender":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+    
+    def close(self) -> None:
+        """Close the SMTP connection, if one is open."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
     
     def send(
         self,
@@ -69,57 +108,182 @@ class SMTPEmailSender:
         """
         logger.info(f"Sending email to {to_email} via SMTP")
         
-        try:
-            # Create message
-            msg = MIMEMultipart()
-            msg["From"] = f"{self._config.from_name} <{self._config.from_email}>"
-            msg["To"] = to_email
-            msg["Subject"] = subject
-            
-            # Add body
-            msg.attach(MIMEText(body, "plain", "utf-8"))
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    self._attach_file(msg, file_path)
-            
-            # Send via SMTP with TLS (30 second timeout)
-            with smtplib.SMTP(self._config.smtp_host, self._config.smtp_port, timeout=30) as server:
-                if self._config.smtp_use_tls:
-                    server.starttls()
-                
-                server.login(
-                    self._config.smtp_username,
-                    self._config.smtp_password
-                )
-                server.send_message(msg)
+        with self._translate_errors():
+            msg = self._build_message(to_email, subject, body, attachments)
+            self._connection().send_message(msg)
+            self._sent_count += 1
+        
+        logger.info(f"Email sent successfully to {to_email}")
+        return True
+    
+    def send_many(
+        self,
+        to_emails: list[str],
+        subject: str,
+        body: str,
+        attachments: list[Path] | None = None,
+    ) -> int:
+        """
+        Send the same email separately to each recipient.
+        
+        The message (and its attachments) is built once, and all
+        recipients share one connection, reset with RSET between
+        messages instead of reconnecting.
+        
+        Args:
+            to_emails: Recipient email addresses.
+            subject: Email subject line.
+            body: Email body (plain text).
+            attachments: Optional list of file paths to attach.
             
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
+        Returns:
+            Number of emails sent.
             
+        Raises:
+            EmailSenderError: If sending to any recipient fails.
+        """
+        if not to_emails:
+            return 0
+        
+        with self._translate_errors():
+            msg = self._build_message(to_emails[0], subject, body, attachments)
+            for index, to_email in enumerate(to_emails):
+                logger.info(f"Sending email to {to_email} via SMTP")
+                if index:
+                    msg.replace_header("To", to_email)
+                    self._reset()
+                self._connection().send_message(msg)
+                self._sent_count += 1
+                logger.info(f"Email sent successfully to {to_email}")
+        
+        return len(to_emails)
+    
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        attachments: list[Path] | None,
+    ) -> EmailMessage:
+        """Create the message (multipart only when there is something to attach)."""
+        msg = EmailMessage()
+        msg["From"] = f"{self._config.from_name} <{self._config.from_email}>"
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        msg.set_content(body)
+        
+        if attachments:
+            msg.make_mixed()
+            for file_path in attachments:
+                self._attach_file(msg, file_path)
+        return msg
+    
+    def _reset(self) -> None:
+        """Reset the open session with RSET, dropping it if the server hung up."""
+        if self._server is None:
+            return
+        try:
+            self._server.rset()
+        except smtplib.SMTPServerDisconnected:
+            # Some servers close the connection on RSET; reconnect on next use
+            self.close()
+    
+    def connect(self) -> None:
+        """
+        Open and authenticate the SMTP connection ahead of the first send.
+        
+        Lets callers overlap the connect/STARTTLS/login round-trips with
+        other work; :meth:`send` reuses the connection.
+        
+        Raises:
+            EmailSenderError: If connecting or logging in fails.
+        """
+        with self._translate_errors():
+            self._connection()
+    
+    @contextmanager
+    def _translate_errors(self) -> Iterator[None]:
+        """Drop the connection and raise EmailSenderError on any failure."""
+        try:
+            yield
         except smtplib.SMTPAuthenticationError as e:
             logger.error(f"SMTP authentication failed: {e}")
+            self.close()
             raise EmailSenderError(
                 "SMTP authentication failed. "
                 "For Gmail, ensure you're using an App Password."
             ) from e
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error: {e}")
+            self.close()
             raise EmailSenderError(f"SMTP error: {e}") from e
         except Exception as e:
             logger.error(f"Unexpected error sending email: {e}")
+            self.close()
             raise EmailSenderError(f"Failed to send email: {e}") from e
     
-    def _attach_file(self, msg: MIMEMultipart, file_path: Path) -> None:
+    def _connection(self) -> smtplib.SMTP:
+        """
+        Get a logged-in SMTP connection, reusing the open one when alive.
+        
+        Returns:
+            Authenticated SMTP connection.
+        """
+        if self._server is not None:
+            if self._sent_count < self.MAX_MESSAGES_PER_CONNECTION and self._is_alive():
+                return self._server
+            self.close()
+        
+        # Connect with TLS and authenticate
+        server = smtplib.SMTP(
+            self._config.smtp_host, self._config.smtp_port, timeout=self.SMTP_TIMEOUT
+        )
+        try:
+            if self._config.smtp_use_tls:
+                server.starttls()
+            
+            server.login(
+                self._config.smtp_username,
+                self._config.smtp_password
+            )
+        except BaseException:
+            server.close()
+            raise
+        
+        self._server = server
+        self._sent_count = 0
+        return server
+    
+    def _is_alive(self) -> bool:
+        """Check the open connection still answers the server."""
+        server = self._server
+        if server is None:
+            return False
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _attach_file(self, msg: EmailMessage, file_path: Path) -> None:
         """Attach a file to the email."""
         if not file_path.exists():
             raise EmailSenderError(f"Attachment not found: {file_path}")
         
+        # Base64-encode the file chunk by chunk, so the raw file is never
+        # read whole; only the encoded text (about 4/3 of the file size) is
+        # kept, and joining it briefly holds it twice
+        encoded = []
         with open(file_path, "rb") as f:
-            part = MIMEApplication(f.read(), Name=file_path.name)
+            while chunk := f.read(self.ATTACHMENT_CHUNK_SIZE):
+                encoded.append(base64.encodebytes(chunk).decode("ascii"))
         
-        part["Content-Disposition"] = f'attachment; filename="{file_path.name}"'
+        # Attached as a pre-encoded part; add_attachment() would need the
+        # whole file as bytes
+        part = EmailMessage(policy=msg.policy)
+        part["Content-Type"] = "application/octet-stream"
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", "attachment", filename=file_path.name)
+        part.set_payload("".join(encoded))
         msg.attach(part)
         logger.debug(f"Attached file: {file_path.name}")
 
@@ -167,6 +331,7 @@ def send_report_email(
     config: EmailConfig,
     report_path: Path,
     request_count: int,
+    sender: Optional[SMTPEmailSender] = None,
 ) -> bool:
     """
     Send the classification report via email.
@@ -175,18 +340,27 @@ def send_report_email(
         config: Email configuration.
         report_path: Path to the Excel report.
         request_count: Number of classified requests.
+        sender: Optional (possibly already connected) sender to use. It is
+            left open for the caller; otherwise a sender is created and
+            closed after sending.
         
     Returns:
         True if sent successfully.
     """
-    sender = SMTPEmailSender(config)
+    owns_sender = sender is None
+    if sender is None:
+        sender = SMTPEmailSender(config)
     
     subject = f"Automation Engineer interview - technical task - {config.sender_name}"
     body = build_report_email_body(request_count, config.codebase_link)
     
-    return sender.send(
-        to_email=config.recipient_email,
-        subject=subject,
-        body=body,
-        attachments=[report_path],
-    )
+    try:
+        return sender.send(
+            to_email=config.recipient_email,
+            subject=subject,
+            body=body,
+            attachments=[report_path],
+        )
+    finally:
+        if owns_sender:
+            sender.close()
@@ -12,9 +12,10 @@ from pathlib import Path
 from typing import Any
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
 from .models import HelpdeskRequest
 from .config import OutputConfig
@@ -31,8 +32,8 @@ class ExcelGeneratorError(Exception):
 # Define column configuration
 COLUMN_CONFIG = [
     {"key": "id", "header": "Request ID", "width": 12},
-    {"key": "short_description", "header": "Short Description", "width": 40},
-    {"key": "long_description", "header": "Long Description", "width": 60},
+    {"key": "short_description", "header": "Short Description", "width": 40, "wrap": True},
+    {"key": "long_description", "header": "Long Description", "width": 60, "wrap": True},
     {"key": "requester_email", "header": "Requester Email", "width": 30},
     {"key": "request_category", "header": "Category", "width": 25},
     {"key": "request_type", "header": "Request Type", "width": 35},
@@ -40,6 +41,9 @@ COLUMN_CONFIG = [
     {"key": "sla_unit", "header": "SLA Unit", "width": 12},
 ]
 
+# Column letters matching COLUMN_CONFIG order ("A", "B", ...)
+COLUMN_LETTERS = [get_column_letter(i) for i in range(1, len(COLUMN_CONFIG) + 1)]
+
 
 def sort_requests(requests: list[HelpdeskRequest]) -> list[HelpdeskRequest]:
     """
@@ -98,7 +102,7 @@ class ExcelReportGenerator:
     Produces professional-looking reports with:
     - Styled headers (bold, colored background)
     - Auto-fitted column widths
-    - Text wrapping for long content
+    - Text wrapping for the description columns
     - Proper borders
     """
     
@@ -107,7 +111,10 @@ class ExcelReportGenerator:
     HEADER_FILL = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
     HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
     
-    CELL_ALIGNMENT = Alignment(vertical="top", wrap_text=True)
+    # Only the free-text columns wrap; wrapping short values just makes Excel
+    # recompute row heights on open
+    CELL_ALIGNMENT = Alignment(vertical="top")
+    WRAP_ALIGNMENT = Alignment(vertical="top", wrap_text=True)
     CELL_BORDER = Border(
         left=Side(style="thin", color="D0D0D0"),
         right=Side(style="thin", color="D0D0D0"),
@@ -119,6 +126,14 @@ class ExcelReportGenerator:
     ROW_FILL_ODD = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
     ROW_FILL_EVEN = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
     
+    # Named styles registered on each workbook, so every cell stores a single
+    # style reference instead of resolving its font/fill/alignment/border
+    HEADER_STYLE = "report_header"
+    ROW_STYLE_ODD = "report_row_odd"
+    ROW_STYLE_EVEN = "report_row_even"
+    ROW_STYLE_ODD_WRAP = "report_row_odd_wrap"
+    ROW_STYLE_EVEN_WRAP = "report_row_even_wrap"
+    
     def __init__(self, config: OutputConfig):
         """
         Initialize the generator.
@@ -146,10 +161,15 @@ class ExcelReportGenerator:
             sorted_requests = sort_requests(requests)
             logger.info(f"Sorted {len(sorted_requests)} requests for report")
             
-            # Create workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Classified Tickets"
+            # Create a write-only workbook: rows are streamed to disk on
+            # save instead of being kept as Cell objects
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Classified Tickets")
+            self._register_styles(wb)
+            
+            # Sheet layout must be set before the first row is appended
+            self._apply_column_widths(ws)
+            ws.freeze_panes = "A2"
             
             # Write headers
             self._write_headers(ws)
@@ -157,12 +177,6 @@ class ExcelReportGenerator:
             # Write data rows
             self._write_data(ws, sorted_requests)
             
-            # Apply column widths
-            self._apply_column_widths(ws)
-            
-            # Freeze header row
-            ws.freeze_panes = "A2"
-            
             # Ensure output directory exists
             self._config.output_dir.mkdir(parents=True, exist_ok=True)
             
@@ -177,36 +191,74 @@ class ExcelReportGenerator:
             logger.error(f"Failed to generate Excel report: {e}")
             raise ExcelGeneratorError(f"Report generation failed: {e}") from e
     
-    def _write_headers(self, ws: Worksheet) -> None:
+    def _register_styles(self, wb: Workbook) -> None:
+        """Add the header and alternating (plain and wrapped) row styles."""
+        wb.add_named_style(NamedStyle(
+            name=self.HEADER_STYLE,
+            font=self.HEADER_FONT,
+            fill=self.HEADER_FILL,
+            alignment=self.HEADER_ALIGNMENT,
+            border=self.CELL_BORDER,
+        ))
+        for name, fill, alignment in (
+            (self.ROW_STYLE_ODD, self.ROW_FILL_ODD, self.CELL_ALIGNMENT),
+            (self.ROW_STYLE_EVEN, self.ROW_FILL_EVEN, self.CELL_ALIGNMENT),
+            (self.ROW_STYLE_ODD_WRAP, self.ROW_FILL_ODD, self.WRAP_ALIGNMENT),
+            (self.ROW_STYLE_EVEN_WRAP, self.ROW_FILL_EVEN, self.WRAP_ALIGNMENT),
+        ):
+            wb.add_named_style(NamedStyle(
+                name=name,
+                fill=fill,
+                alignment=alignment,
+                border=self.CELL_BORDER,
+            ))
+    
+    def _write_headers(self, ws: WriteOnlyWorksheet) -> None:
         """Write and style header row."""
-        for col_idx, col_config in enumerate(COLUMN_CONFIG, 1):
-            cell = ws.cell(row=1, column=col_idx, value=col_config["header"])
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = self.HEADER_ALIGNMENT
-            cell.border = self.CELL_BORDER
-        
         # Set header row height
         ws.row_dimensions[1].height = 30
+        
+        header_cells = []
+        for col_config in COLUMN_CONFIG:
+            cell = WriteOnlyCell(ws, value=col_config["header"])
+            cell.style = self.HEADER_STYLE
+            header_cells.append(cell)
+        ws.append(header_cells)
     
-    def _write_data(self, ws: Worksheet, requests: list[HelpdeskRequest]) -> None:
+    def _write_data(
+        self, ws: WriteOnlyWorksheet, requests: list[HelpdeskRequest]
+    ) -> None:
         """Write data rows with styling."""
+        # Per-column styles for each row colour (alternating, wrapped or not)
+        odd_styles = self._column_styles(self.ROW_STYLE_ODD, self.ROW_STYLE_ODD_WRAP)
+        even_styles = self._column_styles(
+            self.ROW_STYLE_EVEN, self.ROW_STYLE_EVEN_WRAP
+        )
+        
         for row_idx, request in enumerate(requests, 2):
             row_data = request_to_row(request)
+            styles = odd_styles if row_idx % 2 == 0 else even_styles
             
-            # Determine row fill (alternating colors)
-            fill = self.ROW_FILL_ODD if row_idx % 2 == 0 else self.ROW_FILL_EVEN
-            
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.alignment = self.CELL_ALIGNMENT
-                cell.border = self.CELL_BORDER
-                cell.fill = fill
+            row_cells = []
+            for value, style in zip(row_data, styles, strict=True):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                row_cells.append(cell)
+            ws.append(row_cells)
+    
+    @staticmethod
+    def _column_styles(plain: str, wrapped: str) -> list[str]:
+        """Pick the plain or wrapped style for each column in COLUMN_CONFIG."""
+        return [
+            wrapped if col_config.get("wrap") else plain
+            for col_config in COLUMN_CONFIG
+        ]
     
-    def _apply_column_widths(self, ws: Worksheet) -> None:
+    def _apply_column_widths(self, ws: WriteOnlyWorksheet) -> None:
         """Apply column widths from configuration."""
-        for col_idx, col_config in enumerate(COLUMN_CONFIG, 1):
-            column_letter = get_column_letter(col_idx)
+        for column_letter, col_config in zip(
+            COLUMN_LETTERS, COLUMN_CONFIG, strict=True
+        ):
             ws.column_dimensions[column_letter].width = col_config["width"]
 
 
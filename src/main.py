@@ -10,16 +10,17 @@ Orchestrates the complete pipeline:
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
 import click
 
 from .config import get_config, AppConfig
-from .data_sources import fetch_all_data, DataSourceError
-from .classifier import TicketClassifier, ClassificationError
-from .excel_generator import generate_report, ExcelGeneratorError
-from .email_sender import send_report_email, EmailSenderError
+
+# The pipeline stages (httpx, openai, rapidfuzz, openpyxl, ...) are imported
+# inside run_pipeline, so --validate-only and --help start without them
 
 
 def setup_logging(level: str) -> None:
@@ -52,17 +53,18 @@ class PipelineError(Exception):
     pass
 
 
-def validate_config(config: AppConfig) -> None:
+def validate_config(config: AppConfig, include_email: bool = True) -> None:
     """
     Validate configuration before running.
     
     Args:
         config: Application configuration.
+        include_email: Also validate the email settings.
         
     Raises:
         PipelineError: If configuration is invalid.
     """
-    errors = config.validate()
+    errors = config.validate(include_email)
     if errors:
         for error in errors:
             logger.error(f"Configuration error: {error}")
@@ -75,6 +77,7 @@ def run_pipeline(
     config: Optional[AppConfig] = None,
     skip_email: bool = False,
     output_path: Optional[Path] = None,
+    checkpoint_path: Optional[Path] = None,
 ) -> Path:
     """
     Execute the complete ticket automation pipeline.
@@ -83,6 +86,8 @@ def run_pipeline(
         config: Optional configuration override.
         skip_email: If True, skip sending email.
         output_path: Optional custom output path for the report.
+        checkpoint_path: Optional JSONL file recording classified tickets,
+            so an interrupted run can resume where it stopped.
         
     Returns:
         Path to the generated report.
@@ -95,16 +100,13 @@ def run_pipeline(
     
     # Override output path if provided
     if output_path:
-        config = AppConfig(
-            api=config.api,
-            llm=config.llm,
-            email=config.email,
-            output=config.output.__class__(
+        config = replace(
+            config,
+            output=replace(
+                config.output,
                 output_dir=output_path.parent,
                 report_filename=output_path.name,
             ),
-            log_level=config.log_level,
-            classification_batch_size=config.classification_batch_size,
         )
     
     setup_logging(config.log_level)
@@ -113,31 +115,15 @@ def run_pipeline(
     logger.info("=" * 60)
     
     # Validate configuration (skip email validation if not sending)
-    if not skip_email:
-        validate_config(config)
-    else:
-        # Validate only non-email config
-        errors = []
-        if not config.api.helpdesk_webhook_url:
-            errors.append("HELPDESK_WEBHOOK_URL is required")
-        if not config.api.service_catalog_url:
-            errors.append("SERVICE_CATALOG_URL is required")
-        if not config.api.helpdesk_api_key:
-            errors.append("HELPDESK_API_KEY is required")
-        if not config.llm.api_key:
-            errors.append("OPENAI_API_KEY is required")
-        if errors:
-            for error in errors:
-                logger.error(f"Configuration error: {error}")
-            raise PipelineError(
-                f"Configuration validation failed with {len(errors)} error(s)"
-            )
+    validate_config(config, include_email=not skip_email)
     
     # Step 1: Fetch data
     logger.info("-" * 40)
     logger.info("Step 1: Fetching data from external sources")
     logger.info("-" * 40)
     
+    from .data_sources import DataSourceError, fetch_all_data
+    
     try:
         requests, catalog = fetch_all_data(config.api)
         logger.info(f"Fetched {len(requests)} requests")
@@ -150,12 +136,15 @@ def run_pipeline(
     logger.info("Step 2: Classifying requests using LLM")
     logger.info("-" * 40)
     
+    from .classifier import ClassificationError, TicketClassifier
+    
     try:
-        classifier = TicketClassifier(config.llm, catalog)
-        classified_requests = classifier.classify_batch(
-            requests,
-            batch_size=config.classification_batch_size,
-        )
+        with TicketClassifier(config.llm, catalog) as classifier:
+            classified_requests = classifier.classify_batch(
+                requests,
+                batch_size=config.classification_batch_size,
+                output_jsonl=checkpoint_path,
+            )
     except ClassificationError as e:
         raise PipelineError(f"Classification failed: {e}") from e
     
@@ -164,31 +153,48 @@ def run_pipeline(
     logger.info("Step 3: Generating Excel report")
     logger.info("-" * 40)
     
-    try:
-        report_path = generate_report(classified_requests, config.output)
-        logger.info(f"Report generated: {report_path}")
-    except ExcelGeneratorError as e:
-        raise PipelineError(f"Report generation failed: {e}") from e
+    from .excel_generator import ExcelGeneratorError, generate_report
     
-    # Step 4: Send email (optional)
+    sender = None
     if not skip_email:
-        logger.info("-" * 40)
-        logger.info("Step 4: Sending report via email")
-        logger.info("-" * 40)
+        from .email_sender import EmailSenderError, SMTPEmailSender, send_report_email
+        sender = SMTPEmailSender(config.email)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp") as pool:
+            # Connect and log in to SMTP while the report is being written
+            connected = pool.submit(sender.connect) if sender else None
+            
+            try:
+                report_path = generate_report(classified_requests, config.output)
+                logger.info(f"Report generated: {report_path}")
+            except ExcelGeneratorError as e:
+                raise PipelineError(f"Report generation failed: {e}") from e
         
-        try:
-            send_report_email(
-                config.email,
-                report_path,
-                len(classified_requests),
-            )
-            logger.info(f"Email sent to: {config.email.recipient_email}")
-        except EmailSenderError as e:
-            raise PipelineError(f"Email sending failed: {e}") from e
-    else:
-        logger.info("-" * 40)
-        logger.info("Step 4: Skipping email (--skip-email flag)")
-        logger.info("-" * 40)
+        # Step 4: Send email (optional)
+        if sender is not None and connected is not None:
+            logger.info("-" * 40)
+            logger.info("Step 4: Sending report via email")
+            logger.info("-" * 40)
+            
+            try:
+                connected.result()
+                send_report_email(
+                    config.email,
+                    report_path,
+                    len(classified_requests),
+                    sender=sender,
+                )
+                logger.info(f"Email sent to: {config.email.recipient_email}")
+            except EmailSenderError as e:
+                raise PipelineError(f"Email sending failed: {e}") from e
+        else:
+            logger.info("-" * 40)
+            logger.info("Step 4: Skipping email (--skip-email flag)")
+            logger.info("-" * 40)
+    finally:
+        if sender:
+            sender.close()
     
     logger.info("=" * 60)
     logger.info("Pipeline completed successfully!")
@@ -211,6 +217,11 @@ def run_pipeline(
     type=click.Path(dir_okay=False, path_type=Path),
     help="Custom output path for the report",
 )
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="JSONL file to save classified tickets to and resume from",
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -226,6 +237,7 @@ def run_pipeline(
 def main(
     skip_email: bool,
     output: Optional[Path],
+    checkpoint: Optional[Path],
     debug: bool,
     validate_only: bool,
 ) -> None:
@@ -239,14 +251,7 @@ def main(
         config = get_config()
         
         if debug:
-            config = AppConfig(
-                api=config.api,
-                llm=config.llm,
-                email=config.email,
-                output=config.output,
-                log_level="DEBUG",
-                classification_batch_size=config.classification_batch_size,
-            )
+            config = replace(config, log_level="DEBUG")
         
         if validate_only:
             setup_logging(config.log_level)
@@ -255,7 +260,12 @@ def main(
             logger.info("Configuration is valid!")
             return
         
-        run_pipeline(config, skip_email=skip_email, output_path=output)
+        run_pipeline(
+            config,
+            skip_email=skip_email,
+            output_path=output,
+            checkpoint_path=checkpoint,
+        )
         
     except PipelineError as e:
         click.echo(f"Pipeline failed: {e}", err=True)
@@ -5,8 +5,10 @@ Uses Pydantic for robust data validation and serialization.
 All models are immutable by default for thread safety.
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from collections.abc import Iterator, Mapping
+from functools import cached_property
+from typing import Any, Optional, TypeVar
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 
 
 class SLA(BaseModel):
@@ -87,7 +89,28 @@ class ServiceCatalogRequest(BaseModel):
     model_config = {"frozen": True, "extra": "ignore"}
 
 
-class ServiceCategory(BaseModel):
+_IndexedModelT = TypeVar("_IndexedModelT", bound="_IndexedModel")
+
+
+class _IndexedModel(BaseModel):
+    """Base for frozen models that cache lookups with cached_property."""
+    
+    def model_copy(
+        self: _IndexedModelT,
+        *,
+        update: Optional[Mapping[str, Any]] = None,
+        deep: bool = False,
+    ) -> _IndexedModelT:
+        """Copy the model, dropping cached values built from the original."""
+        copied = super().model_copy(update=update, deep=deep)
+        # cached_property values sit in __dict__ next to the fields and
+        # would otherwise describe the original's fields, not the update
+        for name in copied.__dict__.keys() - type(copied).model_fields.keys():
+            del copied.__dict__[name]
+        return copied
+
+
+class ServiceCategory(_IndexedModel):
     """A category in the Service Catalog."""
     
     name: str = Field(default="Unknown Category", description="Category name")
@@ -105,14 +128,18 @@ class ServiceCategory(BaseModel):
     
     def find_request(self, name: str) -> Optional[ServiceCatalogRequest]:
         """Find a request type by name (case-insensitive)."""
-        name_lower = name.lower()
+        return self._requests_by_name.get(name.lower())
+    
+    @cached_property
+    def _requests_by_name(self) -> dict[str, ServiceCatalogRequest]:
+        """Index request types by lowercased name (first one wins)."""
+        index: dict[str, ServiceCatalogRequest] = {}
         for req in self.requests:
-            if req.name.lower() == name_lower:
-                return req
-        return None
+            index.setdefault(req.name.lower(), req)
+        return index
 
 
-class ServiceCatalog(BaseModel):
+class ServiceCatalog(_IndexedModel):
     """
     Complete IT Service Catalog.
     
@@ -133,11 +160,15 @@ class ServiceCatalog(BaseModel):
     
     def find_category(self, name: str) -> Optional[ServiceCategory]:
         """Find a category by name (case-insensitive)."""
-        name_lower = name.lower()
+        return self._categories_by_name.get(name.lower())
+    
+    @cached_property
+    def _categories_by_name(self) -> dict[str, ServiceCategory]:
+        """Index categories by lowercased name (first one wins)."""
+        index: dict[str, ServiceCategory] = {}
         for cat in self.categories:
-            if cat.name.lower() == name_lower:
-                return cat
-        return None
+            index.setdefault(cat.name.lower(), cat)
+        return index
     
     def get_request_type_sla(self, category: str, request_type: str) -> Optional[SLA]:
         """Get SLA for a specific category and request type."""
@@ -152,9 +183,19 @@ class ServiceCatalog(BaseModel):
         """
         Generate a text representation of the catalog for LLM context.
         
+        The catalog is frozen, so the text is rendered once and reused.
+        
         Returns:
             Formatted string describing all categories and request types.
         """
+        return self._classification_context
+    
+    # cached_property values live in the instance __dict__ beside the
+    # fields; pydantic leaves them out of serialization and, from 2.6 on
+    # (the minimum supported version), out of equality
+    @cached_property
+    def _classification_context(self) -> str:
+        """Render the catalog text returned by to_classification_context()."""
         lines = ["IT SERVICE CATALOG:\n"]
         
         for category in self.categories:
@@ -195,6 +236,10 @@ class ClassificationResult(BaseModel):
     model_config = {"frozen": True}
 
 
+# Validates a whole list of raw request dicts in one call
+_REQUEST_LIST_ADAPTER = TypeAdapter(list[HelpdeskRequest])
+
+
 class HelpdeskResponse(BaseModel):
     """Response structure from the helpdesk API."""
     
@@ -220,17 +265,36 @@ class HelpdeskResponse(BaseModel):
             return []
         
         requests_data = self.data.get("requests", [])
-        requests = []
-        
         for i, req_data in enumerate(requests_data):
+            # Ensure minimum required field exists
+            if isinstance(req_data, dict) and "id" not in req_data:
+                req_data["id"] = f"unknown_{i}"
+        
+        # Validate the whole list in a single call; only when an entry is
+        # malformed fall back to validating one by one and skipping it
+        try:
+            return _REQUEST_LIST_ADAPTER.validate_python(requests_data)
+        except ValidationError:
+            return list(self.iter_requests())
+    
+    def iter_requests(self) -> Iterator[HelpdeskRequest]:
+        """
+        Yield requests from the response one at a time.
+        
+        Same handling as :meth:`get_requests`, for consumers that process
+        requests as a stream instead of holding them all in a list.
+        """
+        if not self.data:
+            return
+        
+        for i, req_data in enumerate(self.data.get("requests", [])):
             try:
                 # Ensure minimum required field exists
                 if "id" not in req_data:
                     req_data["id"] = f"unknown_{i}"
-                requests.append(HelpdeskRequest(**req_data))
+                request = HelpdeskRequest(**req_data)
             except Exception:
                 # Skip malformed requests but continue processing
                 continue
-        
-        return requests
+            yield request
 
@@ -8,15 +8,33 @@ Tests cover:
 - Batch processing with error handling
 """
 
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from openai import APIConnectionError
+from tenacity import wait_none
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.classifier import (
+    BATCH_RESPONSE_FORMAT,
+    SINGLE_RESPONSE_FORMAT,
     ClassificationError,
+    LLMBatchClassificationResponse,
+    LLMBatchItem,
     LLMClassificationResponse,
     TicketClassifier,
+    _CandidateIndex,
+    _skip_bigrams,
+    build_batch_user_prompt,
+    build_system_prompt,
     build_user_prompt,
+    ticket_cache_key,
     SYSTEM_PROMPT,
+    VERBOSE_SYSTEM_PROMPT,
 )
 from src.config import LLMConfig
 from src.models import (
@@ -114,7 +132,7 @@ def llm_config() -> LLMConfig:
 @pytest.fixture
 def classifier(llm_config: LLMConfig, sample_catalog: ServiceCatalog) -> TicketClassifier:
     """Create a classifier with mocked OpenAI client."""
-    with patch("src.classifier.OpenAI"):
+    with patch("src.classifier.AsyncOpenAI"):
         return TicketClassifier(llm_config, sample_catalog)
 
 
@@ -154,6 +172,19 @@ class TestLLMClassificationResponse:
                 reasoning="Test",
             )
     
+    def test_to_result_matches_validated_result(self):
+        """Test the unvalidated conversion equals a validated ClassificationResult."""
+        response = LLMClassificationResponse(
+            request_category="Access Management",
+            request_type="Reset forgotten password",
+            confidence=0.95,
+            reasoning="User explicitly needs password reset.",
+        )
+        
+        assert TicketClassifier._to_result(response) == ClassificationResult(
+            **response.model_dump()
+        )
+    
     def test_edge_confidence_values(self):
         """Test edge confidence values are valid."""
         response_zero = LLMClassificationResponse(
@@ -173,6 +204,25 @@ class TestLLMClassificationResponse:
         assert response_one.confidence == 1.0
 
 
+class TestResponseFormats:
+    """Tests for the precomputed JSON-schema response formats."""
+    
+    def test_single_format_is_strict(self):
+        """Test the single-ticket schema is closed and fully required."""
+        schema = SINGLE_RESPONSE_FORMAT["json_schema"]["schema"]
+        
+        assert SINGLE_RESPONSE_FORMAT["json_schema"]["strict"] is True
+        assert schema["additionalProperties"] is False
+        assert set(schema["required"]) == set(LLMClassificationResponse.model_fields)
+    
+    def test_batch_format_closes_nested_items(self):
+        """Test nested batch items are strict as well."""
+        item_schema = BATCH_RESPONSE_FORMAT["json_schema"]["schema"]["$defs"]["LLMBatchItem"]
+        
+        assert item_schema["additionalProperties"] is False
+        assert "ticket_number" in item_schema["required"]
+
+
 # =============================================================================
 # build_user_prompt Tests
 # =============================================================================
@@ -180,30 +230,75 @@ class TestLLMClassificationResponse:
 class TestBuildUserPrompt:
     """Tests for the user prompt builder."""
     
-    def test_prompt_contains_request_info(
-        self, 
-        sample_request: HelpdeskRequest, 
-        sample_catalog: ServiceCatalog
-    ):
+    def test_prompt_contains_request_info(self, sample_request: HelpdeskRequest):
         """Test prompt includes request details."""
-        prompt = build_user_prompt(sample_request, sample_catalog)
+        prompt = build_user_prompt(sample_request)
         
         assert sample_request.id in prompt
         assert sample_request.short_description in prompt
         assert sample_request.long_description in prompt
         assert sample_request.requester_email in prompt
     
-    def test_prompt_contains_catalog_context(
-        self, 
-        sample_request: HelpdeskRequest, 
-        sample_catalog: ServiceCatalog
-    ):
+    def test_prompt_excludes_catalog_context(self, sample_request: HelpdeskRequest):
+        """Test the per-ticket prompt does not repeat the catalog."""
+        prompt = build_user_prompt(sample_request)
+        
+        assert "IT SERVICE CATALOG" not in prompt
+
+
+class TestBuildBatchUserPrompt:
+    """Tests for the multi-ticket prompt builder."""
+    
+    def test_numbers_every_ticket(self, sample_request: HelpdeskRequest):
+        """Test each ticket is numbered and included."""
+        other = HelpdeskRequest(id="req_002", short_description="Need new monitor")
+        prompt = build_batch_user_prompt([sample_request, other])
+        
+        assert "### Ticket 1" in prompt
+        assert "### Ticket 2" in prompt
+        assert sample_request.short_description in prompt
+        assert "Need new monitor" in prompt
+
+
+class TestBuildSystemPrompt:
+    """Tests for the system prompt builder."""
+    
+    def test_prompt_contains_catalog_context(self, sample_catalog: ServiceCatalog):
         """Test prompt includes catalog categories."""
-        prompt = build_user_prompt(sample_request, sample_catalog)
+        prompt = build_system_prompt(sample_catalog)
         
         assert "Access Management" in prompt
         assert "Hardware Support" in prompt
         assert "Software & Licensing" in prompt
+    
+    def test_instructions_form_the_prefix(self, sample_catalog: ServiceCatalog):
+        """Test static instructions come first so the prefix is cacheable."""
+        prompt = build_system_prompt(sample_catalog)
+        
+        assert prompt.startswith(SYSTEM_PROMPT)
+    
+    def test_classifier_builds_prompt_once(
+        self, 
+        classifier: TicketClassifier,
+        sample_catalog: ServiceCatalog,
+    ):
+        """Test classifier precomputes the system prompt."""
+        assert classifier._system_prompt == build_system_prompt(sample_catalog)
+    
+    def test_verbose_prompt_flag(self, sample_catalog: ServiceCatalog):
+        """Test the long-form instructions are used when requested."""
+        prompt = build_system_prompt(sample_catalog, verbose=True)
+        
+        assert prompt.startswith(VERBOSE_SYSTEM_PROMPT)
+        assert len(prompt) > len(build_system_prompt(sample_catalog))
+    
+    def test_classifier_honours_verbose_config(self, sample_catalog: ServiceCatalog):
+        """Test LLMConfig.verbose_prompt selects the long-form instructions."""
+        config = LLMConfig(api_key="test-api-key", verbose_prompt=True)
+        with patch("src.classifier.AsyncOpenAI"):
+            classifier = TicketClassifier(config, sample_catalog)
+        
+        assert classifier._system_prompt.startswith(VERBOSE_SYSTEM_PROMPT)
 
 
 # =============================================================================
@@ -228,6 +323,56 @@ class TestTicketClassifierInit:
         assert "Access Management" in classifier._type_names_by_category
         assert "Reset forgotten password" in classifier._type_names_by_category["Access Management"]
         assert "Laptop Repair/Replacement" in classifier._type_names_by_category["Hardware Support"]
+    
+    def test_merges_duplicate_category_types(self, llm_config: LLMConfig):
+        """Test types of a repeated category name are merged into one entry."""
+        catalog = ServiceCatalog(categories=[
+            ServiceCategory(name="Access", requests=[ServiceCatalogRequest(name="A")]),
+            ServiceCategory(name="Access", requests=[ServiceCatalogRequest(name="B")]),
+        ])
+        with patch("src.classifier.AsyncOpenAI"):
+            classifier = TicketClassifier(llm_config, catalog)
+        
+        assert classifier._type_names_by_category == {"Access": ("A", "B")}
+        assert classifier._all_types == ("A", "B")
+    
+    def test_uses_pooled_http_client(
+        self, 
+        llm_config: LLMConfig, 
+        sample_catalog: ServiceCatalog
+    ):
+        """Test the OpenAI client is given a tuned keep-alive connection pool."""
+        with patch("src.classifier.AsyncOpenAI") as mock_openai, \
+                patch("src.classifier.DefaultAsyncHttpxClient") as mock_http:
+            TicketClassifier(llm_config, sample_catalog)
+        
+        mock_http.assert_called_once_with(
+            limits=TicketClassifier.HTTP_LIMITS,
+            timeout=TicketClassifier.HTTP_TIMEOUT,
+        )
+        assert mock_openai.call_args.kwargs["http_client"] is mock_http.return_value
+    
+    def test_sla_index_matches_catalog_lookup(
+        self, 
+        classifier: TicketClassifier,
+        sample_catalog: ServiceCatalog,
+    ):
+        """Test the SLA index agrees with ServiceCatalog.get_request_type_sla."""
+        for cat in sample_catalog.categories:
+            for req in cat.requests:
+                key = (cat.name.upper(), req.name.upper())
+                assert classifier._sla_index[cat.name.lower(), req.name.lower()] == (
+                    sample_catalog.get_request_type_sla(*key)
+                )
+                assert classifier._sla_index[cat.name, req.name] == (
+                    sample_catalog.get_request_type_sla(*key)
+                )
+    
+    def test_builds_type_to_category_index(self, classifier: TicketClassifier):
+        """Test classifier builds the inverse type -> category index."""
+        assert classifier._type_to_category["Reset forgotten password"] == "Access Management"
+        assert classifier._type_to_category["Software Installation Issue"] == "Software & Licensing"
+        assert len(classifier._all_types) == len(classifier._type_to_category)
 
 
 # =============================================================================
@@ -272,6 +417,58 @@ class TestFindBestMatch:
         candidates = ["Access Management"]
         result = classifier._find_best_match("  Access Management  ", candidates)
         assert result == "Access Management"
+    
+    def test_prefilter_large_candidate_list(self, classifier: TicketClassifier):
+        """Test bigram prefilter keeps the best match in large lists."""
+        candidates = [f"Unrelated Request Type {i}" for i in range(50)]
+        candidates.append("Reset forgotten password")
+        
+        shortlist = classifier._prefilter_candidates(
+            "reset password",
+            _CandidateIndex(candidates),
+        )
+        assert len(shortlist) == TicketClassifier.PREFILTER_TOP_K
+        assert "reset forgotten password" in shortlist.values()
+        
+        result = classifier._find_best_match("Reset password", candidates)
+        assert result == "Reset forgotten password"
+    
+    def test_prefilter_drops_candidates_too_long_to_match(
+        self, classifier: TicketClassifier
+    ):
+        """Test candidates whose length rules out the threshold are not kept."""
+        candidates = [f"VPN Access {'x' * 40} {i}" for i in range(20)]
+        candidates.append("VPN Acess")
+        
+        shortlist = classifier._prefilter_candidates(
+            "vpn access",
+            _CandidateIndex(candidates),
+        )
+        assert list(shortlist.values()) == ["vpn acess"]
+    
+    def test_exact_match_prefers_first_duplicate(self, classifier: TicketClassifier):
+        """Test case-insensitive duplicates resolve to the first candidate."""
+        candidates = ["VPN Access", "vpn access"]
+        result = classifier._find_best_match("VPN ACCESS", candidates)
+        assert result == "VPN Access"
+    
+    def test_precomputed_index(self, classifier: TicketClassifier):
+        """Test matching against the precomputed per-category index."""
+        index = classifier._type_index_by_category["Access Management"]
+        result = classifier._find_best_match("reset forgoten password", index)
+        assert result == "Reset forgotten password"
+
+
+class TestSkipBigrams:
+    """Tests for the bigram prefilter helper."""
+    
+    def test_skip_bigrams(self):
+        """Test 0-skip and 1-skip bigram extraction."""
+        assert _skip_bigrams("abcd") == {"ab", "bc", "cd", "ac", "bd"}
+    
+    def test_short_string(self):
+        """Test strings shorter than two characters have no bigrams."""
+        assert _skip_bigrams("a") == frozenset()
 
 
 # =============================================================================
@@ -375,7 +572,7 @@ class TestNormalizeClassification:
             ]
         )
         
-        with patch("src.classifier.OpenAI"):
+        with patch("src.classifier.AsyncOpenAI"):
             classifier = TicketClassifier(llm_config, catalog)
         
         category, req_type = classifier._normalize_classification(
@@ -387,6 +584,217 @@ class TestNormalizeClassification:
         assert req_type == TicketClassifier.FALLBACK_TYPE
 
 
+class TestNormalizeBatch:
+    """Tests for vectorized normalization of several classifications."""
+    
+    def test_matches_per_ticket_normalization(self, classifier: TicketClassifier):
+        """Test batch results equal normalizing each pair on its own."""
+        pairs = [
+            ("Access Management", "Reset forgotten password"),
+            ("Access Managment", "Reset forgoten password"),
+            ("Reset forgotten password", "Something"),
+            ("Unknown Category XYZ", "Some type"),
+            ("Access Management", "Laptop Repair/Replacement"),
+            ("Access Management", "Completely unknown type"),
+            ("hardware support", "peripheral request (mouse/keyboard/monitor)"),
+        ]
+        
+        expected = [classifier._normalize_classification(c, t) for c, t in pairs]
+        classifier._normalized.clear()
+        
+        assert classifier._normalize_batch(pairs) == expected
+    
+    def test_repeated_answers_skip_fuzzy_matching(self, classifier: TicketClassifier):
+        """Test a remembered answer is not matched against the catalog again."""
+        first = classifier._normalize_classification("Access Managment", "Reset forgoten password")
+        
+        with patch("src.classifier.process") as process:
+            assert classifier._normalize_classification(
+                "Access Managment", "Reset forgoten password"
+            ) == first
+            assert classifier._normalize_batch(
+                [("Access Managment", "Reset forgoten password")]
+            ) == [first]
+        
+        assert not process.mock_calls
+    
+    def test_empty_batch(self, classifier: TicketClassifier):
+        """Test an empty batch normalizes to an empty list."""
+        assert classifier._normalize_batch([]) == []
+    
+    def test_match_many_scores_all_queries(self, classifier: TicketClassifier):
+        """Test exact, fuzzy and unmatched queries in one call."""
+        matches = classifier._match_many(
+            ["access management", "Hardware Suport", "Completely Different"],
+            classifier._category_index,
+        )
+        
+        assert matches == {
+            "access management": "Access Management",
+            "Hardware Suport": "Hardware Support",
+            "Completely Different": None,
+        }
+
+
+# =============================================================================
+# Classify Request Tests
+# =============================================================================
+
+def make_completion(parsed: LLMClassificationResponse) -> Mock:
+    """Build a fake chat completion carrying a JSON structured output."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=parsed.model_dump_json()))]
+    return response
+
+
+class TestClassifyRequest:
+    """Tests for the classify_request method."""
+    
+    @pytest.fixture
+    def parsed(self) -> LLMClassificationResponse:
+        """Structured output returned by the mocked LLM."""
+        return LLMClassificationResponse(
+            request_category="Access Management",
+            request_type="Reset forgotten password",
+            confidence=0.9,
+            reasoning="Password reset request",
+        )
+    
+    def test_returns_classification(
+        self, 
+        classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test the parsed LLM output is returned as a ClassificationResult."""
+        classifier._client.chat.completions.create = AsyncMock(
+            return_value=make_completion(parsed)
+        )
+        
+        result = asyncio.run(classifier.classify_request(sample_request))
+        
+        assert result.request_category == "Access Management"
+        assert result.request_type == "Reset forgotten password"
+        assert result.confidence == 0.9
+        _, kwargs = classifier._client.chat.completions.create.call_args
+        assert kwargs["response_format"] is SINGLE_RESPONSE_FORMAT
+    
+    def test_cache_hit_skips_api(
+        self, 
+        classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test identical ticket text is served from the result cache."""
+        create = AsyncMock(return_value=make_completion(parsed))
+        classifier._client.chat.completions.create = create
+        duplicate = HelpdeskRequest(
+            id="req_002",
+            short_description=sample_request.short_description.upper(),
+            long_description=sample_request.long_description,
+        )
+        
+        first = asyncio.run(classifier.classify_request(sample_request))
+        second = asyncio.run(classifier.classify_request(duplicate))
+        
+        assert first == second
+        assert create.await_count == 1
+    
+    def test_cache_evicts_oldest(
+        self, 
+        classifier: TicketClassifier,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test the result cache is bounded by RESULT_CACHE_SIZE."""
+        classifier.RESULT_CACHE_SIZE = 2
+        classifier._client.chat.completions.create = AsyncMock(
+            return_value=make_completion(parsed)
+        )
+        
+        for i in range(3):
+            request = HelpdeskRequest(id=f"req_{i}", short_description=f"Ticket {i}")
+            asyncio.run(classifier.classify_request(request))
+        
+        assert len(classifier._result_cache) == 2
+    
+    def test_cache_key_normalizes_text(self):
+        """Test cache key ignores case and surrounding whitespace."""
+        a = HelpdeskRequest(id="a", short_description="VPN down ", long_description="")
+        b = HelpdeskRequest(id="b", short_description="vpn down", long_description="")
+        assert ticket_cache_key(a) == ticket_cache_key(b)
+    
+    def test_escalates_low_confidence_to_full_model(
+        self, 
+        sample_catalog: ServiceCatalog,
+        sample_request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test a low-confidence small-model answer is re-asked of LLM_MODEL."""
+        config = LLMConfig(api_key="test-api-key", model="gpt-4o", small_model="llama-8b")
+        with patch("src.classifier.AsyncOpenAI"):
+            classifier = TicketClassifier(config, sample_catalog)
+        unsure = parsed.model_copy(update={"confidence": 0.3, "request_type": "Guess"})
+        create = AsyncMock(side_effect=[
+            make_completion(unsure),
+            make_completion(parsed),
+        ])
+        classifier._client.chat.completions.create = create
+        
+        result = asyncio.run(classifier.classify_request(sample_request))
+        
+        assert result.request_type == "Reset forgotten password"
+        assert [c.kwargs["model"] for c in create.await_args_list] == ["llama-8b", "gpt-4o"]
+    
+    def test_confident_small_model_answer_kept(
+        self, 
+        sample_catalog: ServiceCatalog,
+        sample_request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test answers at or above the threshold are not escalated."""
+        config = LLMConfig(api_key="test-api-key", model="gpt-4o", small_model="llama-8b")
+        with patch("src.classifier.AsyncOpenAI"):
+            classifier = TicketClassifier(config, sample_catalog)
+        create = AsyncMock(return_value=make_completion(parsed))
+        classifier._client.chat.completions.create = create
+        
+        asyncio.run(classifier.classify_request(sample_request))
+        
+        assert create.await_count == 1
+        assert create.await_args.kwargs["model"] == "llama-8b"
+    
+    def test_retries_transient_errors(
+        self, 
+        classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+        parsed: LLMClassificationResponse,
+    ):
+        """Test connection errors are retried before succeeding."""
+        transient = APIConnectionError(request=httpx.Request("POST", "http://llm"))
+        create = AsyncMock(side_effect=[transient, make_completion(parsed)])
+        classifier._client.chat.completions.create = create
+        
+        with patch.object(TicketClassifier._request_single.retry, "wait", wait_none()):
+            result = asyncio.run(classifier.classify_request(sample_request))
+        
+        assert result.request_type == "Reset forgotten password"
+        assert create.await_count == 2
+    
+    def test_does_not_retry_permanent_errors(
+        self, 
+        classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+    ):
+        """Test non-transient errors fail on the first attempt."""
+        create = AsyncMock(side_effect=ValueError("bad schema"))
+        classifier._client.chat.completions.create = create
+        
+        with pytest.raises(ClassificationError, match="bad schema"):
+            asyncio.run(classifier.classify_request(sample_request))
+        
+        assert create.await_count == 1
+
+
 # =============================================================================
 # Classify and Update Tests
 # =============================================================================
@@ -407,14 +815,15 @@ class TestClassifyAndUpdate:
             confidence=0.95,
             reasoning="Password reset request",
         )
-        classifier.classify_request = Mock(return_value=mock_result)
+        classifier.classify_request = AsyncMock(return_value=mock_result)
         
-        updated = classifier.classify_and_update(sample_request)
+        updated = asyncio.run(classifier.classify_and_update(sample_request))
         
         assert updated.request_category == "Access Management"
         assert updated.request_type == "Reset forgotten password"
         assert updated.sla.unit == "hours"
         assert updated.sla.value == 4
+        assert updated is sample_request
     
     def test_uses_fallback_sla_when_not_found(
         self, 
@@ -429,7 +838,7 @@ class TestClassifyAndUpdate:
             confidence=0.5,
             reasoning="Unknown request",
         )
-        classifier.classify_request = Mock(return_value=mock_result)
+        classifier.classify_request = AsyncMock(return_value=mock_result)
         
         # Mock _normalize_classification to return valid category but keep the type
         # that won't have SLA
@@ -438,7 +847,7 @@ class TestClassifyAndUpdate:
             '_normalize_classification',
             return_value=("Other/Uncategorized", "General Inquiry/Undefined")
         ):
-            updated = classifier.classify_and_update(sample_request)
+            updated = asyncio.run(classifier.classify_and_update(sample_request))
         
         # Should have used the SLA from the catalog for General Inquiry
         assert updated.sla is not None
@@ -451,45 +860,55 @@ class TestClassifyAndUpdate:
 class TestClassifyBatch:
     """Tests for batch classification."""
     
-    def test_classifies_all_requests(
-        self, 
-        classifier: TicketClassifier
-    ):
-        """Test all requests in batch are classified."""
-        requests = [
+    @pytest.fixture
+    def requests(self) -> list[HelpdeskRequest]:
+        """Three unclassified requests."""
+        return [
             HelpdeskRequest(id="req_001", short_description="Test 1"),
             HelpdeskRequest(id="req_002", short_description="Test 2"),
             HelpdeskRequest(id="req_003", short_description="Test 3"),
         ]
-        
+    
+    @staticmethod
+    def make_item(number: int, category: str, request_type: str) -> LLMBatchItem:
+        """Build one item of a multi-ticket LLM response."""
+        return LLMBatchItem(
+            ticket_number=number,
+            request_category=category,
+            request_type=request_type,
+            confidence=0.9,
+            reasoning="Test",
+        )
+    
+    def test_classifies_all_requests(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test all requests in batch are classified."""
         # Mock classify_and_update to return the request unchanged
-        classifier.classify_and_update = Mock(side_effect=lambda r: r)
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
         
-        result = classifier.classify_batch(requests)
+        result = classifier.classify_batch(requests, batch_size=1)
         
         assert len(result) == 3
         assert classifier.classify_and_update.call_count == 3
     
     def test_handles_classification_errors(
         self, 
-        classifier: TicketClassifier
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
     ):
         """Test batch continues after classification error."""
-        requests = [
-            HelpdeskRequest(id="req_001", short_description="Test 1"),
-            HelpdeskRequest(id="req_002", short_description="Test 2"),
-            HelpdeskRequest(id="req_003", short_description="Test 3"),
-        ]
-        
         # Second request fails
         def mock_classify(r):
             if r.id == "req_002":
                 raise ClassificationError("API Error")
             return r
         
-        classifier.classify_and_update = Mock(side_effect=mock_classify)
+        classifier.classify_and_update = AsyncMock(side_effect=mock_classify)
         
-        result = classifier.classify_batch(requests)
+        result = classifier.classify_batch(requests, batch_size=1)
         
         # All 3 should be returned (failed one with fallback)
         assert len(result) == 3
@@ -504,6 +923,285 @@ class TestClassifyBatch:
         """Test handling of empty batch."""
         result = classifier.classify_batch([])
         assert result == []
+    
+    def test_packs_tickets_into_one_call(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test a chunk of tickets is classified with a single LLM call."""
+        classifier._request_batch = AsyncMock(
+            return_value=LLMBatchClassificationResponse(results=[
+                self.make_item(1, "Access Management", "Reset forgotten password"),
+                self.make_item(2, "Hardware Support", "Laptop Repair/Replacement"),
+                self.make_item(3, "hardware support", "peripheral request (mouse/keyboard/monitor)"),
+            ])
+        )
+        
+        result = classifier.classify_batch(requests, batch_size=5)
+        
+        assert classifier._request_batch.await_count == 1
+        assert [r.request_type for r in result] == [
+            "Reset forgotten password",
+            "Laptop Repair/Replacement",
+            "Peripheral Request (Mouse/Keyboard/Monitor)",
+        ]
+        assert result[1].sla == SLA(unit="days", value=3)
+    
+    def test_low_confidence_items_escalated_in_one_call(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test unsure small-model batch answers go to the full model together."""
+        classifier._escalate = True
+        unsure = self.make_item(2, "Access Management", "Guess")
+        unsure.confidence = 0.2
+        classifier._request_batch = AsyncMock(side_effect=[
+            LLMBatchClassificationResponse(results=[
+                self.make_item(1, "Access Management", "Reset forgotten password"),
+                unsure,
+                self.make_item(3, "Hardware Support", "Laptop Repair/Replacement"),
+            ]),
+            LLMBatchClassificationResponse(results=[
+                self.make_item(1, "Hardware Support", "Laptop Repair/Replacement"),
+            ]),
+        ])
+        
+        results = asyncio.run(classifier.classify_requests(requests))
+        
+        assert classifier._request_batch.await_count == 2
+        escalation = classifier._request_batch.await_args_list[1]
+        assert escalation.args == ([requests[1]], classifier._config.model)
+        assert results[1].request_type == "Laptop Repair/Replacement"
+    
+    def test_missing_items_classified_individually(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test tickets omitted from a batch response are retried alone."""
+        classifier._request_batch = AsyncMock(
+            return_value=LLMBatchClassificationResponse(results=[
+                self.make_item(1, "Access Management", "Reset forgotten password"),
+                self.make_item(3, "Access Management", "Reset forgotten password"),
+                self.make_item(9, "Access Management", "Reset forgotten password"),
+            ])
+        )
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
+        
+        result = classifier.classify_batch(requests, batch_size=5)
+        
+        assert len(result) == 3
+        classifier.classify_and_update.assert_awaited_once_with(requests[1])
+    
+    def test_failed_batch_falls_back_per_ticket(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test every ticket is retried alone when the batch call fails."""
+        classifier.classify_requests = AsyncMock(
+            side_effect=ClassificationError("Bad batch")
+        )
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
+        
+        result = classifier.classify_batch(requests, batch_size=5)
+        
+        assert [r.id for r in result] == ["req_001", "req_002", "req_003"]
+        assert classifier.classify_and_update.await_count == 3
+    
+    def test_duplicate_tickets_classified_once(self, classifier: TicketClassifier):
+        """Test identical ticket text is sent once and the result fanned out."""
+        requests = [
+            HelpdeskRequest(id="req_001", short_description="VPN down"),
+            HelpdeskRequest(id="req_002", short_description="Need a monitor"),
+            HelpdeskRequest(id="req_003", short_description="vpn down "),
+        ]
+        
+        def mock_classify(r):
+            r.request_category = "Network & Connectivity"
+            r.request_type = r.short_description
+            return r
+        
+        classifier.classify_and_update = AsyncMock(side_effect=mock_classify)
+        
+        result = classifier.classify_batch(requests, batch_size=1)
+        
+        assert classifier.classify_and_update.await_count == 2
+        assert [r.id for r in result] == ["req_001", "req_002", "req_003"]
+        assert result[2].request_type == "VPN down"
+        assert result[2].request_category == "Network & Connectivity"
+    
+    def test_writes_checkpoint(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+        tmp_path,
+    ):
+        """Test every classified request is appended to the JSONL checkpoint."""
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
+        
+        classifier.classify_batch(requests, batch_size=1, output_jsonl=checkpoint)
+        
+        lines = checkpoint.read_text(encoding="utf-8").splitlines()
+        ids = {HelpdeskRequest.model_validate_json(line).id for line in lines}
+        assert ids == {"req_001", "req_002", "req_003"}
+    
+    def test_resumes_from_checkpoint(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+        tmp_path,
+    ):
+        """Test checkpointed requests are reused instead of reclassified."""
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        done = requests[1].model_copy(update={"request_category": "Security"})
+        checkpoint.write_text(
+            done.model_dump_json() + "\n" + '{"id": "req_00',  # truncated by a crash
+            encoding="utf-8",
+        )
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
+        
+        result = classifier.classify_batch(requests, batch_size=1, output_jsonl=checkpoint)
+        
+        assert [r.id for r in result] == ["req_001", "req_002", "req_003"]
+        assert result[1].request_category == "Security"
+        assert classifier.classify_and_update.await_count == 2
+        # The truncated line is terminated, so new records stay readable
+        assert set(TicketClassifier._read_checkpoint(checkpoint)) == {
+            "req_001", "req_002", "req_003"
+        }
+    
+    def test_no_resume_overwrites_checkpoint(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+        tmp_path,
+    ):
+        """Test resume=False reclassifies everything and rewrites the file."""
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        checkpoint.write_text(requests[0].model_dump_json() + "\n", encoding="utf-8")
+        classifier.classify_and_update = AsyncMock(side_effect=lambda r: r)
+        
+        classifier.classify_batch(
+            requests, batch_size=1, output_jsonl=checkpoint, resume=False
+        )
+        
+        assert classifier.classify_and_update.await_count == 3
+        assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 3
+    
+    def test_limits_concurrency_and_preserves_order(
+        self, 
+        classifier: TicketClassifier
+    ):
+        """Test at most `concurrency` calls are in flight and order is kept."""
+        requests = [
+            HelpdeskRequest(id=f"req_{i:03d}", short_description=f"Test {i}")
+            for i in range(7)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def mock_classify(r):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return r
+        
+        classifier.classify_and_update = AsyncMock(side_effect=mock_classify)
+        
+        result = classifier.classify_batch(requests, batch_size=1, concurrency=3)
+        
+        assert [r.id for r in result] == [r.id for r in requests]
+        assert 1 < max_in_flight <= 3
+
+
+class TestClassifyBatchOffline:
+    """Tests for classification through the Batch API."""
+    
+    @pytest.fixture
+    def requests(self) -> list[HelpdeskRequest]:
+        """Two unclassified requests."""
+        return [
+            HelpdeskRequest(id="req_001", short_description="Forgot password"),
+            HelpdeskRequest(id="req_002", short_description="Need a monitor"),
+        ]
+    
+    @staticmethod
+    def output_line(custom_id: str, category: str, request_type: str) -> str:
+        """Build one line of a Batch API output file."""
+        content = LLMClassificationResponse(
+            request_category=category,
+            request_type=request_type,
+            confidence=0.9,
+            reasoning="Test",
+        ).model_dump_json()
+        return json.dumps({
+            "custom_id": custom_id,
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+        })
+    
+    def mock_batch_api(self, classifier: TicketClassifier, output: str) -> None:
+        """Make the mocked client run a job that finishes on the first poll."""
+        client = classifier._client
+        client.files.create = AsyncMock(return_value=Mock(id="file-in"))
+        client.batches.create = AsyncMock(
+            return_value=Mock(id="batch_1", status="in_progress")
+        )
+        client.batches.retrieve = AsyncMock(return_value=Mock(
+            id="batch_1", status="completed", output_file_id="file-out"
+        ))
+        client.files.content = AsyncMock(return_value=Mock(text=output))
+    
+    def test_submits_one_job_and_joins_results(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test every ticket goes into one input file and results map back."""
+        self.mock_batch_api(classifier, "\n".join([
+            self.output_line("1", "Hardware Support", "peripheral request (mouse/keyboard/monitor)"),
+            self.output_line("0", "Access Management", "Reset forgotten password"),
+        ]))
+        
+        result = classifier.classify_batch_offline(requests, poll_interval=0)
+        
+        _, kwargs = classifier._client.files.create.call_args
+        _, payload = kwargs["file"]
+        lines = [json.loads(line) for line in payload.decode().splitlines()]
+        assert [line["custom_id"] for line in lines] == ["0", "1"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"]["response_format"]["type"] == "json_schema"
+        
+        assert [r.request_type for r in result] == [
+            "Reset forgotten password",
+            "Peripheral Request (Mouse/Keyboard/Monitor)",
+        ]
+        assert result[0].sla == SLA(unit="hours", value=4)
+    
+    def test_missing_results_classified_online(
+        self, 
+        classifier: TicketClassifier,
+        requests: list[HelpdeskRequest],
+    ):
+        """Test tickets without a usable result fall back to the online path."""
+        self.mock_batch_api(classifier, "\n".join([
+            self.output_line("0", "Access Management", "Reset forgotten password"),
+            '{"custom_id": "1", "response": null, "error": {"code": "server_error"}}',
+        ]))
+        classifier.classify_batch_async = AsyncMock(side_effect=lambda rs: rs)
+        
+        result = classifier.classify_batch_offline(requests, poll_interval=0)
+        
+        assert result[0].request_type == "Reset forgotten password"
+        classifier.classify_batch_async.assert_awaited_once_with([requests[1]])
 
 
 # =============================================================================
@@ -521,8 +1219,12 @@ class TestSystemPrompt:
     
     def test_contains_examples(self):
         """Test prompt contains examples."""
-        assert "Example 1:" in SYSTEM_PROMPT
         assert "Forgot my Okta password" in SYSTEM_PROMPT
+        assert "Example 1:" in VERBOSE_SYSTEM_PROMPT
+    
+    def test_compact_prompt_is_shorter(self):
+        """Test the default prompt is well under the long-form size."""
+        assert len(SYSTEM_PROMPT) < len(VERBOSE_SYSTEM_PROMPT) / 2
     
     def test_contains_saas_instructions(self):
         """Test prompt contains SaaS platform instructions."""
@@ -560,3 +1262,131 @@ class TestFallbackValues:
         """Test similarity threshold is reasonable."""
         assert 0.5 <= TicketClassifier.SIMILARITY_THRESHOLD <= 0.9
 
+
+
+# =============================================================================
+# Real HTTP Client Tests
+# =============================================================================
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    """Answer every chat completion with one fixed classification."""
+    
+    # HTTP/1.1 keeps connections alive, so the client pool reuses them
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        content = LLMClassificationResponse(
+            request_category="Access Management",
+            request_type="Reset forgotten password",
+            confidence=0.9,
+            reasoning="Password reset request",
+        ).model_dump_json()
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def llm_base_url():
+    """Serve fake chat completions on a local port; yields the API base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRealHttpClient:
+    """Tests sending requests through the real OpenAI client stack."""
+    
+    @pytest.fixture
+    def live_classifier(
+        self,
+        sample_catalog: ServiceCatalog,
+        llm_base_url: str,
+    ):
+        """Classifier whose unpatched client talks to the local server."""
+        config = LLMConfig(api_key="test-api-key", api_base_url=llm_base_url)
+        with TicketClassifier(config, sample_catalog) as classifier:
+            yield classifier
+    
+    def test_classify_request(
+        self,
+        live_classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+    ):
+        """Test a completion round-trips through the configured HTTP client."""
+        async def classify() -> ClassificationResult:
+            # Async callers close the client on the loop that used it
+            try:
+                return await live_classifier.classify_request(sample_request)
+            finally:
+                await live_classifier.aclose()
+        
+        result = asyncio.run(classify())
+        
+        assert result.request_category == "Access Management"
+        assert result.request_type == "Reset forgotten password"
+    
+    def test_classify_batch_twice(
+        self,
+        live_classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+    ):
+        """Test pooled connections survive across synchronous batch calls."""
+        for attempt in range(2):
+            # A distinct ticket each time, so the result cache is not used
+            request = sample_request.model_copy(
+                update={"short_description": f"Password reset {attempt}"}
+            )
+            [classified] = live_classifier.classify_batch([request], batch_size=1)
+            
+            assert classified.request_category == "Access Management"
+    
+    def test_close_releases_client_threads_and_loop(
+        self,
+        live_classifier: TicketClassifier,
+        sample_request: HelpdeskRequest,
+    ):
+        """Test close() shuts the HTTP client and event loop."""
+        live_classifier.classify_batch([sample_request], batch_size=1)
+        loop = live_classifier._loop
+        
+        live_classifier.close()
+        
+        assert live_classifier._client.is_closed()
+        assert loop.is_closed()
+        # A second close is a no-op
+        live_classifier.close()
+    
+    def test_close_inside_running_loop_points_to_aclose(
+        self,
+        live_classifier: TicketClassifier,
+    ):
+        """Test close() refuses to run on a loop and leaves aclose() usable."""
+        async def close_from_async() -> None:
+            with pytest.raises(RuntimeError, match="aclose"):
+                live_classifier.close()
+            await live_classifier.aclose()
+        
+        asyncio.run(close_from_async())
+        
+        assert live_classifier._client.is_closed()
@@ -1,6 +1,9 @@
 """Tests for configuration module."""
 
 import os
+from dataclasses import replace
+from pathlib import Path
+
 import pytest
 from unittest.mock import patch
 
@@ -10,10 +13,20 @@ from src.config import (
     EmailConfig,
     OutputConfig,
     AppConfig,
+    _dotenv_values,
     get_config,
 )
 
 
+@pytest.fixture(autouse=True)
+def dotenv_file():
+    """Replace the .env file with an empty one so tests see only os.environ."""
+    _dotenv_values.cache_clear()
+    with patch("src.config.dotenv_values", return_value={}) as dotenv_values:
+        yield dotenv_values
+    _dotenv_values.cache_clear()
+
+
 class TestAPIConfig:
     """Tests for APIConfig."""
     
@@ -45,6 +58,33 @@ class TestLLMConfig:
         with patch.dict(os.environ, {}, clear=True):
             config = LLMConfig()
             assert config.temperature == 0.1
+    
+    def test_compact_prompt_by_default(self):
+        """Test the compact system prompt is the default."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert LLMConfig().verbose_prompt is False
+        with patch.dict(os.environ, {"LLM_VERBOSE_PROMPT": "true"}):
+            assert LLMConfig().verbose_prompt is True
+    
+    def test_no_small_model_by_default(self):
+        """Test model escalation is off unless LLM_SMALL_MODEL is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = LLMConfig()
+            assert config.small_model is None
+            assert config.escalation_confidence == 0.5
+    
+    def test_values_are_parsed_to_field_types(self):
+        """Test raw environment strings are converted per field."""
+        env = {
+            "LLM_SMALL_MODEL": "",
+            "LLM_TEMPERATURE": "0.7",
+            "LLM_MAX_TOKENS": "250",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = LLMConfig()
+            assert config.small_model is None
+            assert config.temperature == 0.7
+            assert config.max_tokens == 250
 
 
 class TestEmailConfig:
@@ -72,6 +112,24 @@ class TestOutputConfig:
         """Test report path property."""
         config = OutputConfig()
         assert config.report_path.name == "classified_tickets_report.xlsx"
+    
+    def test_report_path_computed_once(self):
+        """Test the report path is derived at construction and reused."""
+        config = OutputConfig(output_dir=Path("/tmp/out"), report_filename="r.xlsx")
+        
+        assert config.report_path == Path("/tmp/out/r.xlsx")
+        assert config.report_path is config.report_path
+    
+    def test_replace_recomputes_report_path(self):
+        """Test dataclasses.replace derives the report path from the new values."""
+        config = replace(OutputConfig(), output_dir=Path("/tmp/out"), report_filename="r.xlsx")
+        
+        assert config.report_path == Path("/tmp/out/r.xlsx")
+    
+    def test_config_sections_use_slots(self):
+        """Test config instances carry no per-instance __dict__."""
+        for config in (APIConfig(), LLMConfig(), EmailConfig(), OutputConfig(), AppConfig()):
+            assert not hasattr(config, "__dict__")
 
 
 class TestAppConfig:
@@ -127,6 +185,21 @@ class TestAppConfig:
         )
         errors = config.validate()
         assert len(errors) == 0
+    
+    def test_validate_without_email(self):
+        """Test email settings are only required when sending the report."""
+        config = AppConfig(
+            api=APIConfig(
+                helpdesk_webhook_url="https://example.com/webhook",
+                helpdesk_api_key="test",
+                service_catalog_url="https://example.com/catalog",
+            ),
+            llm=LLMConfig(api_key="sk-test"),
+            email=EmailConfig(smtp_username="", smtp_password=""),
+        )
+        
+        assert config.validate(include_email=False) == []
+        assert "SMTP_USERNAME is required" in config.validate()
 
 
 class TestGetConfig:
@@ -137,3 +210,30 @@ class TestGetConfig:
         config = get_config()
         assert isinstance(config, AppConfig)
 
+    
+    def test_returns_cached_instance(self):
+        """Test repeated calls share one instance until the cache is cleared."""
+        get_config.cache_clear()
+        first = get_config()
+        assert get_config() is first
+        
+        get_config.cache_clear()
+        assert get_config() is not first
+    
+    def test_parses_dotenv_once(self, dotenv_file):
+        """Test the .env file is parsed on first use and only once."""
+        get_config.cache_clear()
+        get_config()
+        get_config.cache_clear()
+        get_config()
+        
+        dotenv_file.assert_called_once()
+    
+    def test_environment_overrides_dotenv(self, dotenv_file):
+        """Test .env fills gaps while process variables take precedence."""
+        dotenv_file.return_value = {"LLM_MODEL": "from-dotenv", "LOG_LEVEL": "DEBUG"}
+        with patch.dict(os.environ, {"LLM_MODEL": "from-env"}, clear=True):
+            config = AppConfig()
+            assert config.llm.model == "from-env"
+            assert config.log_level == "DEBUG"
+            assert "LOG_LEVEL" not in os.environ
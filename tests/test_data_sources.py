@@ -1,6 +1,12 @@
 """Tests for data source clients."""
 
+import asyncio
+import io
+import json
+
+import httpx
 import pytest
+import yaml
 from unittest.mock import Mock, patch, MagicMock
 
 from src.config import APIConfig
@@ -9,6 +15,8 @@ from src.data_sources import (
     ServiceCatalogClient,
     HelpdeskAPIError,
     ServiceCatalogError,
+    _YamlLoader,
+    fetch_all_data,
 )
 from src.models import ServiceCatalog
 
@@ -39,11 +47,40 @@ class TestHelpdeskClient:
         with pytest.raises(RuntimeError, match="context manager"):
             client.fetch_requests()
     
+    def test_injected_client_left_open(self, config):
+        """Test a shared HTTP client is used as-is and not closed on exit."""
+        shared = MagicMock()
+        
+        with HelpdeskClient(config, client=shared) as client:
+            assert client._client is shared
+        
+        shared.close.assert_not_called()
+    
+    def test_sends_precomputed_credentials(self, config):
+        """Test the pre-encoded JSON body carries the API credentials."""
+        sent = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"response_code": 200, "data": {"requests": []}})
+        
+        with httpx.Client(transport=httpx.MockTransport(handler)) as http:
+            client = HelpdeskClient(config, client=http)
+            client.fetch_requests()
+            client.fetch_requests()
+        
+        assert [r.headers["Content-Type"] for r in sent] == ["application/json"] * 2
+        assert json.loads(sent[0].content) == {
+            "api_key": config.helpdesk_api_key,
+            "api_secret": config.helpdesk_api_secret,
+        }
+        assert sent[0].content == sent[1].content
+    
     @patch("src.data_sources.httpx.Client")
     def test_fetch_success(self, mock_client_class, config):
         """Test successful request fetch."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "response_code": 200,
             "data": {
                 "requests": [
@@ -58,7 +95,7 @@ class TestHelpdeskClient:
                     }
                 ]
             }
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         
         mock_client = MagicMock()
@@ -77,9 +114,9 @@ class TestHelpdeskClient:
     def test_fetch_auth_error(self, mock_client_class, config):
         """Test authentication error handling."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "response_code": 401,
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         
         mock_client = MagicMock()
@@ -126,27 +163,259 @@ service_catalog:
               value: 7
 """
     
-    @patch("src.data_sources.httpx.Client")
-    def test_fetch_catalog_success(self, mock_client_class, config, sample_yaml):
+    def test_fetch_catalog_success(self, config, sample_yaml):
         """Test successful catalog fetch."""
-        mock_response = Mock()
-        mock_response.text = sample_yaml
-        mock_response.raise_for_status = Mock()
-        
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=sample_yaml.encode())
+        )
         
-        with ServiceCatalogClient(config) as client:
-            client._client = mock_client
-            catalog = client.fetch_catalog()
+        with httpx.Client(transport=transport) as http:
+            catalog = ServiceCatalogClient(config, client=http).fetch_catalog()
         
         assert isinstance(catalog, ServiceCatalog)
         assert len(catalog.categories) == 2
         assert catalog.categories[0].name == "Access Management"
     
+    def test_fetch_catalog_http_error(self, config):
+        """Test a failing status is reported before the body is parsed."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        
+        with httpx.Client(transport=transport) as http:
+            with pytest.raises(ServiceCatalogError, match="HTTP error: 503"):
+                ServiceCatalogClient(config, client=http).fetch_catalog()
+    
+    def test_unchanged_catalog_revalidated_with_etag(self, config, sample_yaml, tmp_path):
+        """Test a saved catalog is reused when the server answers 304."""
+        config = APIConfig(
+            service_catalog_url=config.service_catalog_url,
+            service_catalog_cache_file=tmp_path / "catalog.json",
+        )
+        seen_etags = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=sample_yaml.encode(), headers={"ETag": '"v1"'})
+        
+        with httpx.Client(transport=httpx.MockTransport(handler)) as http:
+            first = ServiceCatalogClient(config, client=http).fetch_catalog()
+            second = ServiceCatalogClient(config, client=http).fetch_catalog()
+        
+        assert seen_etags == [None, '"v1"']
+        assert second == first
+        assert second.get_category_names() == ["Access Management", "Hardware Support"]
+    
+    def test_unreadable_catalog_cache_ignored(self, config, sample_yaml, tmp_path):
+        """Test a corrupt cache file falls back to an unconditional fetch."""
+        cache_file = tmp_path / "catalog.json"
+        cache_file.write_text("{not json")
+        config = APIConfig(
+            service_catalog_url=config.service_catalog_url,
+            service_catalog_cache_file=cache_file,
+        )
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=sample_yaml.encode())
+        )
+        
+        with httpx.Client(transport=transport) as http:
+            catalog = ServiceCatalogClient(config, client=http).fetch_catalog()
+        
+        assert len(catalog.categories) == 2
+    
     def test_context_manager(self, config):
         """Test client works as context manager."""
         with ServiceCatalogClient(config) as client:
             assert client._client is not None
         assert client._client is None
 
+    
+    @pytest.mark.parametrize("content", [
+        "catalog:\n  categories:\n    - name: Security\n",
+        "categories:\n  - name: Security\n",
+        "- name: Security\n",
+    ])
+    def test_parse_alternate_layouts(self, config, content):
+        """Test categories are found under each supported key path."""
+        catalog = ServiceCatalogClient(config)._parse_catalog(content)
+        
+        assert [cat.name for cat in catalog.categories] == ["Security"]
+    
+    def test_parsed_catalog_matches_validated_models(self, config):
+        """Test unvalidated construction yields the same catalog as validation."""
+        catalog = ServiceCatalogClient(config)._parse_catalog(
+            "categories:\n"
+            "  - name: Security\n"
+            "    requests:\n"
+            "      - name: Badge\n"
+            "        sla: {unit: Hours, value: 4}\n"
+            "      - name: Broken\n"
+            "        sla: {unit: hours, value: -1}\n"
+        )
+        
+        assert catalog == ServiceCatalog.model_validate({"categories": [{
+            "name": "Security",
+            "requests": [{"name": "Badge", "sla": {"unit": "hours", "value": 4}}],
+        }]})
+    
+    def test_duplicate_category_names_renamed(self, config):
+        """Test repeated and missing category names are made unique."""
+        catalog = ServiceCatalogClient(config)._parse_catalog(
+            "categories:\n  - name: Security\n  - name: Security\n  - name: ''\n"
+        )
+        
+        assert catalog.get_category_names() == [
+            "Security", "Security (2)", "Unknown Category 3",
+        ]
+    
+    def test_catalog_names_interned(self, config):
+        """Test names from separate parses share one string object."""
+        client = ServiceCatalogClient(config)
+        content = "categories:\n  - name: Security\n    requests:\n      - name: Badge\n"
+        first = client._parse_catalog(content).categories[0]
+        second = client._parse_catalog(content).categories[0]
+        
+        assert first.name is second.name
+        assert first.requests[0].name is second.requests[0].name
+    
+    def test_parse_unexpected_layout(self, config):
+        """Test a document without a category list yields an empty catalog."""
+        catalog = ServiceCatalogClient(config)._parse_catalog(
+            "service_catalog: null\ncategories: not-a-list\n"
+        )
+        
+        assert catalog.categories == []
+    
+    def test_unchanged_catalog_parsed_once(self, config, sample_yaml):
+        """Test identical catalog content is served from the parse cache."""
+        ServiceCatalogClient._catalog_cache.clear()
+        client = ServiceCatalogClient(config)
+        
+        with patch.object(
+            client, "_parse_catalog", wraps=client._parse_catalog
+        ) as parse:
+            first = client._parse_catalog_cached(sample_yaml.encode())
+            second = client._parse_catalog_cached(sample_yaml.encode())
+            client._parse_catalog_cached(sample_yaml.encode() + b"\n# changed\n")
+        
+        assert first is second
+        assert parse.call_count == 2
+    
+    def test_parse_cache_needs_key_for_streams(self, config, sample_yaml):
+        """Test a stream without a precomputed key is rejected up front."""
+        client = ServiceCatalogClient(config)
+        
+        with pytest.raises(ValueError, match="key is required"):
+            client._parse_catalog_cached(io.BytesIO(sample_yaml.encode()))
+    
+    def test_uses_libyaml_loader_when_available(self):
+        """Test the C loader is picked whenever PyYAML was built with libyaml."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert _YamlLoader is expected
+
+
+class TestFetchAllData:
+    """Tests for fetching both data sources."""
+    
+    def test_fetches_both_sources_concurrently(self):
+        """Test both endpoints are requested together over one async client."""
+        config = APIConfig(
+            helpdesk_webhook_url="https://test.example.com/webhook",
+            service_catalog_url="https://test.example.com/catalog",
+        )
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if request.method == "POST":
+                return httpx.Response(200, json={
+                    "response_code": 200,
+                    "data": {"requests": [{"id": "req_001"}]},
+                })
+            return httpx.Response(200, content=b"categories:\n  - name: Security\n")
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        
+        with patch(
+            "src.data_sources.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+        ) as client_class:
+            requests, catalog = fetch_all_data(config)
+        
+        client_class.assert_called_once_with(timeout=config.request_timeout)
+        assert max_in_flight == 2
+        assert [r.id for r in requests] == ["req_001"]
+        assert catalog.get_category_names() == ["Security"]
+    
+    def test_async_errors_are_translated(self):
+        """Test transport failures surface as data source errors."""
+        config = APIConfig(
+            helpdesk_webhook_url="https://test.example.com/webhook",
+            service_catalog_url="https://test.example.com/catalog",
+        )
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"response_code": 200, "data": {"requests": []}})
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        
+        with patch(
+            "src.data_sources.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            with pytest.raises(ServiceCatalogError, match="Request failed"):
+                fetch_all_data(config)
+    
+    def test_failed_fetch_cancels_the_other(self):
+        """Test a failing fetch cancels its sibling before the client closes."""
+        config = APIConfig(
+            helpdesk_webhook_url="https://test.example.com/webhook",
+            service_catalog_url="https://test.example.com/catalog",
+        )
+        clients = []
+        closed_when_cancelled = []
+        
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                raise httpx.ConnectError("refused", request=request)
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                closed_when_cancelled.append(clients[0].is_closed)
+                raise
+            return httpx.Response(200, json={"response_code": 200, "data": {"requests": []}})
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        
+        def make_client(**kwargs) -> httpx.AsyncClient:
+            clients.append(real_client(transport=transport, **kwargs))
+            return clients[-1]
+        
+        with patch("src.data_sources.httpx.AsyncClient", side_effect=make_client):
+            with pytest.raises(ServiceCatalogError, match="Request failed"):
+                fetch_all_data(config)
+        
+        assert closed_when_cancelled == [False]
+    
+    def test_sync_wrapper_refuses_running_loop(self):
+        """Test fetch_all_data points async callers to afetch_all_data."""
+        config = APIConfig(
+            helpdesk_webhook_url="https://test.example.com/webhook",
+            service_catalog_url="https://test.example.com/catalog",
+        )
+        
+        async def call_sync() -> None:
+            fetch_all_data(config)
+        
+        with pytest.raises(RuntimeError, match="afetch_all_data"):
+            asyncio.run(call_sync())
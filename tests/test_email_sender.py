@@ -1,9 +1,15 @@
 """Tests for email sender module."""
 
+import base64
+import smtplib
+import socket
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+
 import pytest
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
-from unittest.mock import Mock, patch, MagicMock
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, create_autospec, patch
 
 from src.config import EmailConfig
 from src.email_sender import (
@@ -14,12 +20,31 @@ from src.email_sender import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    """Fail fast instead of waiting on a TCP timeout if a test is not mocked."""
+    def deny(*args, **kwargs):
+        raise RuntimeError("network access is forbidden in unit tests")
+    
+    # Name resolution comes before the socket, and can stall on its own
+    for name in ("socket", "create_connection", "getaddrinfo"):
+        monkeypatch.setattr(socket, name, deny)
+
+
+@pytest.fixture(scope="module")
+def dummy_attachment(tmp_path_factory):
+    """Write one small report file shared by the attachment tests."""
+    path = tmp_path_factory.mktemp("attach") / "report.xlsx"
+    path.write_bytes(b"test content")
+    return path
+
+
 class TestSMTPEmailSender:
     """Tests for SMTPEmailSender."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self):
-        """Create test email config."""
+        """Create test email config (frozen, so shared by the module)."""
         return EmailConfig(
             smtp_host="smtp.test.com",
             smtp_port=587,
@@ -33,19 +58,38 @@ class TestSMTPEmailSender:
             sender_name="Test User",
         )
     
-    def test_init(self, config):
+    @pytest.fixture(scope="module")
+    def smtp_spec(self):
+        """Autospec of an SMTP connection: only real methods, signature-checked."""
+        # Autospeccing introspects the whole class, so it is built once and
+        # reset for each test instead
+        return create_autospec(smtplib.SMTP, instance=True)
+    
+    @pytest.fixture(autouse=True)
+    def mock_smtp(self, smtp_spec):
+        """Patch smtplib.SMTP for every test, so no test can open a socket."""
+        smtp_spec.reset_mock(return_value=True, side_effect=True)
+        with patch("src.email_sender.smtplib.SMTP", return_value=smtp_spec) as mock_smtp:
+            yield mock_smtp
+    
+    @pytest.fixture
+    def mock_server(self, mock_smtp):
+        """The mocked SMTP connection, answering NOOP as a live server."""
+        server = mock_smtp.return_value
+        server.noop.return_value = (250, b"OK")
+        return server
+    
+    @pytest.fixture
+    def sender(self, config):
+        """Create a sender (per test: it holds the open connection)."""
+        return SMTPEmailSender(config)
+    
+    def test_init(self, sender, config):
         """Test sender initialization."""
-        sender = SMTPEmailSender(config)
         assert sender._config == config
     
-    @patch("src.email_sender.smtplib.SMTP")
-    def test_send_success(self, mock_smtp, config):
+    def test_send_success(self, mock_server, sender):
         """Test successful email sending."""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__ = Mock(return_value=mock_server)
-        mock_smtp.return_value.__exit__ = Mock(return_value=False)
-        
-        sender = SMTPEmailSender(config)
         result = sender.send(
             to_email="recipient@test.com",
             subject="Test Subject",
@@ -56,35 +100,28 @@ class TestSMTPEmailSender:
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("test@test.com", "test-password")
         mock_server.send_message.assert_called_once()
+        
+        # Without attachments the body is sent as a single text part
+        msg = mock_server.send_message.call_args.args[0]
+        assert msg.get_content_type() == "text/plain"
+        assert msg["Subject"] == "Test Subject"
     
-    @patch("src.email_sender.smtplib.SMTP")
-    def test_send_with_attachment(self, mock_smtp, config):
+    def test_send_with_attachment(self, mock_server, sender, dummy_attachment):
         """Test sending with attachment."""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__ = Mock(return_value=mock_server)
-        mock_smtp.return_value.__exit__ = Mock(return_value=False)
-        
-        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-            f.write(b"test content")
-            temp_path = Path(f.name)
+        result = sender.send(
+            to_email="recipient@test.com",
+            subject="Test Subject",
+            body="Test body",
+            attachments=[dummy_attachment],
+        )
         
-        try:
-            sender = SMTPEmailSender(config)
-            result = sender.send(
-                to_email="recipient@test.com",
-                subject="Test Subject",
-                body="Test body",
-                attachments=[temp_path],
-            )
-            
-            assert result is True
-        finally:
-            temp_path.unlink()
+        assert result is True
+        msg = mock_server.send_message.call_args.args[0]
+        assert msg.get_body(("plain",)).get_content() == "Test body\n"
+        assert [p.get_filename() for p in msg.iter_attachments()] == ["report.xlsx"]
     
-    def test_send_attachment_not_found(self, config):
+    def test_send_attachment_not_found(self, sender):
         """Test error when attachment doesn't exist."""
-        sender = SMTPEmailSender(config)
-        
         with pytest.raises(EmailSenderError, match="not found"):
             sender.send(
                 to_email="recipient@test.com",
@@ -93,17 +130,9 @@ class TestSMTPEmailSender:
                 attachments=[Path("/nonexistent/file.xlsx")],
             )
     
-    @patch("src.email_sender.smtplib.SMTP")
-    def test_send_auth_error(self, mock_smtp, config):
+    def test_send_auth_error(self, mock_server, sender):
         """Test authentication error handling."""
-        import smtplib
-        
-        mock_server = MagicMock()
         mock_server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"Auth failed")
-        mock_smtp.return_value.__enter__ = Mock(return_value=mock_server)
-        mock_smtp.return_value.__exit__ = Mock(return_value=False)
-        
-        sender = SMTPEmailSender(config)
         
         with pytest.raises(EmailSenderError, match="authentication failed"):
             sender.send(
@@ -111,25 +140,121 @@ class TestSMTPEmailSender:
                 subject="Test",
                 body="Test",
             )
+    
+    def test_connection_reused_between_sends(self, mock_smtp, mock_server, config):
+        """Test consecutive sends share one connection and login."""
+        with SMTPEmailSender(config) as sender:
+            sender.send(to_email="a@test.com", subject="One", body="Body")
+            sender.send(to_email="b@test.com", subject="Two", body="Body")
+        
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_called_once()
+    
+    def test_reconnects_when_connection_dropped(self, mock_smtp, mock_server, config):
+        """Test a connection that fails NOOP is replaced before sending."""
+        mock_server.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+        
+        with SMTPEmailSender(config) as sender:
+            sender.send(to_email="a@test.com", subject="One", body="Body")
+            sender.send(to_email="b@test.com", subject="Two", body="Body")
+        
+        assert mock_smtp.call_count == 2
+        assert mock_server.login.call_count == 2
+    
+    def test_send_many_resets_between_recipients(self, mock_smtp, mock_server, config):
+        """Test one connection is reset with RSET between recipients."""
+        recipients = []
+        mock_server.send_message.side_effect = lambda msg: recipients.append(msg["To"])
+        
+        with SMTPEmailSender(config) as sender:
+            sent = sender.send_many(["a@test.com", "b@test.com"], "Subject", "Body")
+        
+        assert sent == 2
+        assert recipients == ["a@test.com", "b@test.com"]
+        mock_smtp.assert_called_once()
+        mock_server.rset.assert_called_once()
+    
+    def test_send_many_reconnects_after_rset_hangup(self, mock_smtp, mock_server, config):
+        """Test a server closing the session on RSET gets a new connection."""
+        mock_server.rset.side_effect = smtplib.SMTPServerDisconnected("bye")
+        
+        with SMTPEmailSender(config) as sender:
+            sender.send_many(["a@test.com", "b@test.com"], "Subject", "Body")
+        
+        assert mock_smtp.call_count == 2
+        assert mock_server.send_message.call_count == 2
+    
+    def test_connect_ahead_of_send(self, mock_smtp, mock_server, config):
+        """Test a pre-opened connection is used by the following send."""
+        with SMTPEmailSender(config) as sender:
+            sender.connect()
+            mock_server.login.assert_called_once()
+            sender.send(to_email="a@test.com", subject="One", body="Body")
+        
+        mock_smtp.assert_called_once()
+        mock_server.send_message.assert_called_once()
+    
+    def test_connect_auth_error(self, mock_server, config):
+        """Test login failures during connect raise EmailSenderError."""
+        mock_server.login.side_effect = smtplib.SMTPAuthenticationError(
+            535, b"Auth failed"
+        )
+        
+        with pytest.raises(EmailSenderError, match="authentication failed"):
+            SMTPEmailSender(config).connect()
+        mock_server.close.assert_called_once()
+    
+    def test_attachment_encoded_in_chunks(self, config, monkeypatch):
+        """Test the file is read in bounded chunks and round-trips intact."""
+        chunk_size = 57 * 2
+        monkeypatch.setattr(SMTPEmailSender, "ATTACHMENT_CHUNK_SIZE", chunk_size)
+        data = bytes(range(256)) * 3
+        read_sizes = []
+        
+        def spy_open(*args, **kwargs):
+            f = open(*args, **kwargs)
+            read = f.read
+            
+            def sized_read(size=-1):
+                chunk = read(size)
+                read_sizes.append(len(chunk))
+                return chunk
+            
+            f.read = sized_read
+            return f
+        
+        monkeypatch.setattr("src.email_sender.open", spy_open, raising=False)
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "report.xlsx"
+            path.write_bytes(data)
+            msg = EmailMessage()
+            msg.set_content("Body")
+            msg.make_mixed()
+            SMTPEmailSender(config)._attach_file(msg, path)
+        
+        parsed = message_from_bytes(msg.as_bytes(), policy=policy.default)
+        part = list(parsed.iter_attachments())[0]
+        assert part.get_payload() == base64.encodebytes(data).decode("ascii")
+        assert part.get_content() == data
+        assert part.get_content_type() == "application/octet-stream"
+        assert part.get_filename() == "report.xlsx"
+        # The raw file is never read whole
+        assert sum(read_sizes) == len(data)
+        assert max(read_sizes) <= chunk_size
 
 
 class TestBuildReportEmailBody:
     """Tests for email body builder."""
     
-    def test_contains_request_count(self):
-        """Test body contains request count."""
-        body = build_report_email_body(42, "https://github.com/test")
-        assert "42" in body
-    
-    def test_contains_codebase_link(self):
-        """Test body contains codebase link."""
+    def test_contains_expected_content(self):
+        """Test body contains the request count, codebase link and sorting info."""
         link = "https://github.com/test/repo"
-        body = build_report_email_body(10, link)
+        body = build_report_email_body(42, link)
+        
+        assert "42" in body
         assert link in body
-    
-    def test_contains_sorting_info(self):
-        """Test body explains sorting order."""
-        body = build_report_email_body(10, "https://test.com")
         assert "Category" in body
         assert "ascending" in body.lower()
 
@@ -138,7 +263,7 @@ class TestSendReportEmail:
     """Tests for send_report_email function."""
     
     @patch("src.email_sender.SMTPEmailSender")
-    def test_send_report_email(self, mock_sender_class):
+    def test_send_report_email(self, mock_sender_class, dummy_attachment):
         """Test send_report_email function."""
         mock_sender = MagicMock()
         mock_sender.send.return_value = True
@@ -153,17 +278,24 @@ class TestSendReportEmail:
             recipient_email="recipient@test.com",
         )
         
-        with TemporaryDirectory() as tmpdir:
-            report_path = Path(tmpdir) / "report.xlsx"
-            report_path.write_bytes(b"test")
-            
-            result = send_report_email(config, report_path, 42)
+        result = send_report_email(config, dummy_attachment, 42)
         
         assert result is True
         mock_sender.send.assert_called_once()
         
+        mock_sender.close.assert_called_once()
+        
         # Check subject format
         call_args = mock_sender.send.call_args
         assert "Test User" in call_args.kwargs["subject"]
         assert "technical task" in call_args.kwargs["subject"]
-
+    
+    def test_send_report_email_keeps_given_sender_open(self):
+        """Test a caller-provided sender is used and not closed."""
+        sender = MagicMock()
+        config = EmailConfig(sender_name="Test User", recipient_email="r@test.com")
+        
+        assert send_report_email(config, Path("report.xlsx"), 1, sender=sender)
+        
+        sender.send.assert_called_once()
+        sender.close.assert_not_called()
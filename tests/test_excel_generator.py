@@ -14,63 +14,59 @@ from src.excel_generator import (
 )
 
 
+def _request(
+    id: str, category: str, request_type: str, short_description: str
+) -> HelpdeskRequest:
+    """Build a classified request for the sorting cases."""
+    return HelpdeskRequest(
+        id=id,
+        short_description=short_description,
+        requester_email="test@test.com",
+        request_category=category,
+        request_type=request_type,
+    )
+
+
+# (requests, expected id order), built once at import; sort_requests returns
+# a new list, so the shared tuples are never mutated
+SORT_CASES = {
+    "by_category": (
+        (
+            _request("1", "Security", "Type A", "Z test"),
+            _request("2", "Access Management", "Type A", "A test"),
+        ),
+        ["2", "1"],
+    ),
+    # Same category, sorted by type then description
+    "hierarchical": (
+        (
+            _request("1", "Access", "Type B", "B test"),
+            _request("2", "Access", "Type A", "A test"),
+            _request("3", "Access", "Type B", "A test"),
+        ),
+        ["2", "3", "1"],
+    ),
+    # 'a' < 'r', so "Hardware Support" sorts before "HR & Onboarding"
+    "case_insensitive": (
+        (
+            _request("1", "HR & Onboarding", "Type A", "A test"),
+            _request("2", "Hardware Support", "Type A", "A test"),
+        ),
+        ["2", "1"],
+    ),
+}
+
+
 class TestSortRequests:
     """Tests for request sorting."""
     
-    def test_sort_by_category(self):
-        """Test sorting by category."""
-        requests = [
-            HelpdeskRequest(
-                id="1",
-                short_description="Z test",
-                requester_email="test@test.com",
-                request_category="Security",
-                request_type="Type A",
-            ),
-            HelpdeskRequest(
-                id="2",
-                short_description="A test",
-                requester_email="test@test.com",
-                request_category="Access Management",
-                request_type="Type A",
-            ),
-        ]
-        sorted_reqs = sort_requests(requests)
-        assert sorted_reqs[0].request_category == "Access Management"
-        assert sorted_reqs[1].request_category == "Security"
-    
-    def test_sort_hierarchical(self):
-        """Test hierarchical sorting."""
-        requests = [
-            HelpdeskRequest(
-                id="1",
-                short_description="B test",
-                requester_email="test@test.com",
-                request_category="Access",
-                request_type="Type B",
-            ),
-            HelpdeskRequest(
-                id="2",
-                short_description="A test",
-                requester_email="test@test.com",
-                request_category="Access",
-                request_type="Type A",
-            ),
-            HelpdeskRequest(
-                id="3",
-                short_description="A test",
-                requester_email="test@test.com",
-                request_category="Access",
-                request_type="Type B",
-            ),
-        ]
-        sorted_reqs = sort_requests(requests)
-        
-        # Same category, sorted by type then description
-        assert sorted_reqs[0].request_type == "Type A"
-        assert sorted_reqs[1].request_type == "Type B"
-        assert sorted_reqs[1].short_description == "A test"
-        assert sorted_reqs[2].short_description == "B test"
+    @pytest.mark.parametrize(
+        "requests, expected_ids", list(SORT_CASES.values()), ids=list(SORT_CASES)
+    )
+    def test_sort(self, requests, expected_ids):
+        """Test hierarchical sorting by category, type and description."""
+        sorted_reqs = sort_requests(list(requests))
+        assert [r.id for r in sorted_reqs] == expected_ids
 
 
 class TestRequestToRow:
@@ -136,19 +132,57 @@ class TestExcelReportGenerator:
             assert report_path.exists()
             assert report_path.suffix == ".xlsx"
             
-            # Verify file is valid Excel
+            # Verify file is valid Excel; values only, streamed without styles
             from openpyxl import load_workbook
-            wb = load_workbook(report_path)
-            ws = wb.active
+            wb = load_workbook(report_path, read_only=True, data_only=True)
+            header, *rows = wb.active.iter_rows(values_only=True)
+            wb.close()
             
             # Check headers
-            assert ws.cell(1, 1).value == "Request ID"
-            assert ws.cell(1, 5).value == "Category"
+            assert header[0] == "Request ID"
+            assert header[4] == "Category"
             
             # Check data rows (sorted: Access Management before Hardware Support)
-            assert ws.cell(2, 1).value == "req_001"
-            assert ws.cell(3, 1).value == "req_002"
+            assert [row[0] for row in rows] == ["req_001", "req_002"]
+            assert list(rows[1]) == request_to_row(requests[1])
+    
+    def test_generate_report_layout(self):
+        """Test the streamed sheet keeps widths, frozen header and row styling."""
+        requests = [
+            HelpdeskRequest(id=f"req_{i}", request_category="Access")
+            for i in range(3)
+        ]
+        
+        with TemporaryDirectory() as tmpdir:
+            config = OutputConfig(output_dir=Path(tmpdir), report_filename="r.xlsx")
+            report_path = generate_report(requests, config)
+            
+            from openpyxl import load_workbook
+            ws = load_workbook(report_path).active
             
-            # Check header styling
+            assert ws.title == "Classified Tickets"
+            assert ws.freeze_panes == "A2"
+            assert ws.column_dimensions["C"].width == 60
+            assert ws.row_dimensions[1].height == 30
             assert ws.cell(1, 1).font.bold is True
-
+            assert ws.cell(2, 1).fill.start_color.rgb.endswith("F2F2F2")
+            assert ws.cell(3, 1).fill.start_color.rgb.endswith("FFFFFF")
+            assert not ws.cell(2, 1).alignment.wrap_text
+            assert ws.cell(2, 3).alignment.wrap_text is True
+            assert ws.max_row == 4
+    
+    def test_rows_use_named_styles(self):
+        """Test cells reference the registered named styles."""
+        requests = [HelpdeskRequest(id="a"), HelpdeskRequest(id="b")]
+        
+        with TemporaryDirectory() as tmpdir:
+            config = OutputConfig(output_dir=Path(tmpdir), report_filename="r.xlsx")
+            report_path = generate_report(requests, config)
+            
+            from openpyxl import load_workbook
+            ws = load_workbook(report_path).active
+            
+            assert ws.cell(1, 1).style == ExcelReportGenerator.HEADER_STYLE
+            assert ws.cell(2, 1).style == ExcelReportGenerator.ROW_STYLE_ODD
+            assert ws.cell(3, 8).style == ExcelReportGenerator.ROW_STYLE_EVEN
+            assert ws.cell(3, 2).style == ExcelReportGenerator.ROW_STYLE_EVEN_WRAP
@@ -8,9 +8,14 @@ from src.models import (
     ServiceCategory,
     ServiceCatalogRequest,
     ClassificationResult,
+    HelpdeskResponse,
 )
 
 
+# Text the rendered classification context must contain for sample_catalog
+EXPECTED_CONTEXT_TOKENS = ("Access Management", "Reset forgotten password", "4 hours")
+
+
 class TestSLA:
     """Tests for SLA model."""
     
@@ -26,53 +31,61 @@ class TestSLA:
         assert sla.unit == "hours"
         assert sla.value == 4
     
-    def test_sla_unit_normalization(self):
+    @pytest.mark.parametrize("raw, normalized", [
+        ("Hours", "hours"),
+        ("HOURS", "hours"),
+        ("hours", "hours"),
+        ("Days", "days"),
+        ("DAYS", "days"),
+    ])
+    def test_sla_unit_normalization(self, raw, normalized):
         """Test that SLA units are normalized."""
-        sla = SLA(unit="Hours", value=4)
-        assert sla.unit == "hours"
+        sla = SLA(unit=raw, value=4)
+        assert sla.unit == normalized
+
+
+@pytest.fixture(scope="module")
+def make_request():
+    """Build requests from a shared base, overriding only what a test needs."""
+    base = {
+        "id": "req_001",
+        "short_description": "Test",
+        "requester_email": "test@example.com",
+    }
+    
+    def make(**overrides) -> HelpdeskRequest:
+        return HelpdeskRequest(**{**base, **overrides})
+    
+    return make
 
 
 class TestHelpdeskRequest:
     """Tests for HelpdeskRequest model."""
     
-    def test_needs_classification_empty(self):
+    def test_needs_classification_empty(self, make_request):
         """Test classification check for empty request."""
-        request = HelpdeskRequest(
-            id="req_001",
-            short_description="Test",
-            requester_email="test@example.com",
-        )
+        request = make_request()
         assert request.needs_classification() is True
     
-    def test_needs_classification_partial(self):
+    def test_needs_classification_partial(self, make_request):
         """Test classification check for partially filled request."""
-        request = HelpdeskRequest(
-            id="req_001",
-            short_description="Test",
-            requester_email="test@example.com",
-            request_category="Access Management",
-        )
+        request = make_request(request_category="Access Management")
         assert request.needs_classification() is True
     
-    def test_needs_classification_complete(self):
+    def test_needs_classification_complete(self, make_request):
         """Test classification check for complete request."""
-        request = HelpdeskRequest(
-            id="req_001",
-            short_description="Test",
-            requester_email="test@example.com",
+        request = make_request(
             request_category="Access Management",
             request_type="Reset forgotten password",
             sla=SLA(unit="hours", value=4),
         )
         assert request.needs_classification() is False
     
-    def test_get_full_description(self):
+    def test_get_full_description(self, make_request):
         """Test full description generation."""
-        request = HelpdeskRequest(
-            id="req_001",
+        request = make_request(
             short_description="Password reset",
             long_description="I forgot my password",
-            requester_email="test@example.com",
         )
         full = request.get_full_description()
         assert "Password reset" in full
@@ -82,30 +95,39 @@ class TestHelpdeskRequest:
 class TestServiceCatalog:
     """Tests for ServiceCatalog model."""
     
-    @pytest.fixture
+    # Module-scoped: the tests only read the catalog. Its lookups and
+    # classification context are cached on first use, so later tests also
+    # exercise the cached path.
+    @pytest.fixture(scope="module")
     def sample_catalog(self):
-        """Create a sample catalog for testing."""
-        return ServiceCatalog(
+        """
+        Create a sample catalog for testing.
+        
+        Built with model_construct, as the catalog parser does, since the
+        values are already valid; validation is covered by TestSLA and
+        the other model tests.
+        """
+        return ServiceCatalog.model_construct(
             categories=[
-                ServiceCategory(
+                ServiceCategory.model_construct(
                     name="Access Management",
                     requests=[
-                        ServiceCatalogRequest(
+                        ServiceCatalogRequest.model_construct(
                             name="Reset forgotten password",
-                            sla=SLA(unit="hours", value=4),
+                            sla=SLA.model_construct(unit="hours", value=4),
                         ),
-                        ServiceCatalogRequest(
+                        ServiceCatalogRequest.model_construct(
                             name="MFA Reset",
-                            sla=SLA(unit="hours", value=2),
+                            sla=SLA.model_construct(unit="hours", value=2),
                         ),
                     ],
                 ),
-                ServiceCategory(
+                ServiceCategory.model_construct(
                     name="Hardware Support",
                     requests=[
-                        ServiceCatalogRequest(
+                        ServiceCatalogRequest.model_construct(
                             name="Laptop Repair",
-                            sla=SLA(unit="days", value=7),
+                            sla=SLA.model_construct(unit="days", value=7),
                         ),
                     ],
                 ),
@@ -124,6 +146,21 @@ class TestServiceCatalog:
         assert cat is not None
         assert cat.name == "Access Management"
     
+    def test_find_returns_first_of_duplicate_names(self):
+        """Test lookups keep first-match semantics for case-duplicates."""
+        first = ServiceCatalogRequest(name="Badge", sla=SLA(unit="hours", value=1))
+        catalog = ServiceCatalog(categories=[
+            ServiceCategory(name="Security", requests=[
+                first, ServiceCatalogRequest(name="BADGE"),
+            ]),
+            ServiceCategory(name="security"),
+        ])
+        
+        cat = catalog.find_category("SECURITY")
+        assert cat is catalog.categories[0]
+        assert cat.find_request("badge") is cat.requests[0]
+        assert catalog.get_request_type_sla("security", "badge") == first.sla
+    
     def test_find_category_not_found(self, sample_catalog):
         """Test finding non-existent category."""
         cat = sample_catalog.find_category("nonexistent")
@@ -142,9 +179,51 @@ class TestServiceCatalog:
     def test_to_classification_context(self, sample_catalog):
         """Test context generation for LLM."""
         context = sample_catalog.to_classification_context()
-        assert "Access Management" in context
-        assert "Reset forgotten password" in context
-        assert "4 hours" in context
+        missing = [token for token in EXPECTED_CONTEXT_TOKENS if token not in context]
+        assert not missing, missing
+    
+    def test_classification_context_rendered_once(self, sample_catalog):
+        """Test the context is cached without affecting model equality."""
+        fresh = sample_catalog.model_copy(deep=True)
+        
+        first = sample_catalog.to_classification_context()
+        assert sample_catalog.to_classification_context() is first
+        assert sample_catalog == fresh
+        assert "_classification_context" not in sample_catalog.model_dump()
+    
+    def test_warm_catalog_equals_cold_one(self):
+        """Test populated lookup caches do not affect catalog equality."""
+        def build() -> ServiceCatalog:
+            return ServiceCatalog(categories=[
+                ServiceCategory(name="Security", requests=[
+                    ServiceCatalogRequest(name="Badge"),
+                ]),
+            ])
+        
+        warm, cold = build(), build()
+        warm.find_category("security").find_request("badge")
+        warm.to_classification_context()
+        
+        assert warm == cold
+        assert cold == warm
+    
+    def test_updated_copy_rebuilds_cached_lookups(self, sample_catalog):
+        """Test a copy made with update= does not reuse the original's caches."""
+        category = sample_catalog.find_category("Access Management")
+        sample_catalog.to_classification_context()
+    
+        renamed = category.model_copy(update={"requests": [
+            ServiceCatalogRequest(name="Unlock account"),
+        ]})
+        copied = sample_catalog.model_copy(update={"categories": [renamed]})
+    
+        assert copied.find_category("Hardware Support") is None
+        assert copied.find_category("Access Management") is renamed
+        assert renamed.find_request("Reset forgotten password") is None
+        assert renamed.find_request("unlock account") is not None
+        assert "Hardware Support" not in copied.to_classification_context()
+        assert "Unlock account" in copied.to_classification_context()
+        assert sample_catalog.find_category("Hardware Support") is not None
 
 
 class TestClassificationResult:
@@ -170,3 +249,46 @@ class TestClassificationResult:
                 confidence=1.5,  # Invalid: > 1.0
             )
 
+
+class TestHelpdeskResponse:
+    """Tests for HelpdeskResponse model."""
+    
+    @pytest.fixture
+    def response(self):
+        """Response with a valid, an id-less and a malformed request."""
+        return HelpdeskResponse(
+            response_code=200,
+            data={"requests": [
+                {"id": "req_1", "short_description": "Printer"},
+                {"short_description": "No id"},
+                {"id": "req_3", "sla": "not-an-sla"},
+            ]},
+        )
+    
+    def test_get_requests_skips_malformed(self, response):
+        """Test malformed requests are skipped and missing ids filled in."""
+        assert [r.id for r in response.get_requests()] == ["req_1", "unknown_1"]
+    
+    def test_get_requests_all_valid(self):
+        """Test a clean payload is validated in one pass with the same result."""
+        response = HelpdeskResponse(
+            response_code=200,
+            data={"requests": [{"id": "a", "sla": {"unit": "Hours", "value": 2}}, {}]},
+        )
+        
+        requests = response.get_requests()
+        
+        assert requests == list(response.iter_requests())
+        assert [r.id for r in requests] == ["a", "unknown_1"]
+        assert requests[0].sla == SLA(unit="hours", value=2)
+    
+    def test_iter_requests_is_lazy(self, response):
+        """Test requests are validated one at a time as they are consumed."""
+        requests = response.iter_requests()
+        
+        assert next(requests).id == "req_1"
+        assert [r.id for r in requests] == ["unknown_1"]
+    
+    def test_no_data(self):
+        """Test a response without data yields no requests."""
+        assert HelpdeskResponse(response_code=200).get_requests() == []